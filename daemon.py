@@ -1,28 +1,77 @@
 import ctypes
+import heapq
+import sys
 import time
 from collections import defaultdict
+from copy import deepcopy
 from ctypes import wintypes
 from math import sqrt
 from multiprocessing import get_context
-from pathlib import Path
-from typing import List, Set, Dict, Optional, ItemsView
+from multiprocessing.process import BaseProcess
+from threading import Thread
+from typing import List, Set, Dict, Optional, ItemsView, Tuple, FrozenSet, Union
 
 import win32api
 import win32con
 import win32gui
 import win32process
 
-from settings import WindowAttributes, SettingsManager, Cell, ExcludeWindow
+from settings import WindowAttributes, SettingsManager, Cell
 
 DWMWA_EXTENDED_FRAME_BOUNDS = 9
 
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_HIDE = 0x8003
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+GA_PARENT = 1
+PM_REMOVE = 0x0001
+WH_MOUSE_LL = 14
+HC_ACTION = 0
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE = ctypes.c_void_p(-3)
+
+WinEventProcType = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND, wintypes.LONG,
+                                      wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+LowLevelMouseProcType = ctypes.WINFUNCTYPE(wintypes.LPARAM, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+
+# the prototype is set once, so that ctypes does not have to guess the argument types on every call.
+# LONG instead of HRESULT, so that a failed call returns its code instead of raising an exception
+DwmGetWindowAttribute = ctypes.windll.dwmapi.DwmGetWindowAttribute
+DwmGetWindowAttribute.argtypes = (wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD)
+DwmGetWindowAttribute.restype = wintypes.LONG
+RECT_SIZE = ctypes.sizeof(wintypes.RECT)
+
+OpenProcess = ctypes.windll.kernel32.OpenProcess
+OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+OpenProcess.restype = wintypes.HANDLE
+QueryFullProcessImageNameW = ctypes.windll.kernel32.QueryFullProcessImageNameW
+QueryFullProcessImageNameW.argtypes = (wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, wintypes.PDWORD)
+QueryFullProcessImageNameW.restype = wintypes.BOOL
+CloseHandle = ctypes.windll.kernel32.CloseHandle
+CloseHandle.argtypes = (wintypes.HANDLE,)
+CloseHandle.restype = wintypes.BOOL
+PROCESS_PATH_MAX_LENGTH = 32768
+
+SET_POS_FLAGS = win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
+
+# classes of the desktop and taskbar windows
+IGNORED_WINDOW_CLASSES = frozenset(("Progman", "WorkerW", "Shell_TrayWnd", "Shell_SecondaryTrayWnd"))
+
 
 class MouseTracker:
     """
     Class for tracking mouse actions.
 
     Attributes:
-        is_holding (bool): Indicates if the left mouse button is held down.
+        is_holding (bool): Indicates if the left mouse button is pressed.
         hold_start_time (float): Left mouse button press time.
         hold_threshold (float): Threshold value after which we consider that the left mouse button is held down, not just clicked.
     """
@@ -32,6 +81,48 @@ class MouseTracker:
         self.hold_start_time: float = time.time()
         self.hold_threshold: float = hold_threshold
 
+        self._callback = LowLevelMouseProcType(self._handle_mouse_event)
+        """LowLevelMouseProcType: Hook callback. A reference must be kept while the hook is installed."""
+
+        self._hook: Optional[int] = None
+        """Optional[int]: Handle of the installed low level mouse hook."""
+
+    def hook(self):
+        """
+        Install a low level mouse hook, so that the button state is updated by events instead of polling.
+        The hook callback is called while the thread messages are dispatched.
+        """
+        user32 = ctypes.windll.user32
+        user32.SetWindowsHookExW.restype = wintypes.HANDLE
+        user32.SetWindowsHookExW.argtypes = (ctypes.c_int, LowLevelMouseProcType, wintypes.HINSTANCE, wintypes.DWORD)
+        user32.CallNextHookEx.restype = wintypes.LPARAM
+        user32.CallNextHookEx.argtypes = (wintypes.HANDLE, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+        ctypes.windll.kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+        module_handle = ctypes.windll.kernel32.GetModuleHandleW(None)
+        self._hook = user32.SetWindowsHookExW(WH_MOUSE_LL, self._callback, module_handle, 0) or None
+        self.is_holding = self.is_left_mouse_button_down()
+
+    def unhook(self):
+        """Remove the low level mouse hook."""
+        if self._hook is not None:
+            ctypes.windll.user32.UnhookWindowsHookEx(wintypes.HANDLE(self._hook))
+            self._hook = None
+
+    def _handle_mouse_event(self, n_code: int, w_param: int, l_param: int) -> int:
+        if n_code == HC_ACTION:
+            if w_param == win32con.WM_LBUTTONDOWN:
+                self._set_button_state(True)
+            elif w_param == win32con.WM_LBUTTONUP:
+                self._set_button_state(False)
+        return ctypes.windll.user32.CallNextHookEx(None, n_code, w_param, l_param)
+
+    def _set_button_state(self, is_down: bool):
+        # If the button has not been pressed before, we initiate the tracking fields
+        if is_down and not self.is_holding:
+            self.hold_start_time = time.time()
+        self.is_holding = is_down
+
     def is_left_mouse_button_down(self) -> bool:
         """
         Checking whether the left mouse button is pressed.
@@ -40,7 +131,7 @@ class MouseTracker:
             True if the left mouse button is pressed otherwise False.
         """
         # VK_LBUTTON is the virtual-key code for the left mouse button
-        return win32api.GetKeyState(0x01) & 0x8000 > 0
+        return win32api.GetAsyncKeyState(0x01) & 0x8000 > 0
 
     def is_left_mouse_button_hold(self) -> bool:
         """
@@ -49,23 +140,18 @@ class MouseTracker:
         Returns:
             True if the left mouse button is held down otherwise False
         """
-        if self.is_left_mouse_button_down():
-            # If the button has not been pressed before, we initiate the tracking fields
-            if not self.is_holding:
-                self.hold_start_time = time.time()
-                self.is_holding = True
-            # If the time elapsed from pressing the button is more than the threshold value,
-            # then the button is considered to be held down
-            elif time.time() - self.hold_start_time >= self.hold_threshold:
-                return True
-        else:
-            # If the button has been pressed before, unset is_holding
-            if self.is_holding:
-                if time.time() - self.hold_start_time < self.hold_threshold:
-                    return False
-                self.is_holding = False
-
-        return False
+        # without the hook the button state has to be polled
+        if self._hook is None:
+            self._set_button_state(self.is_left_mouse_button_down())
+        # Windows silently removes the hook if its callback takes too long, and the button release is then missed,
+        # so the pressed state is confirmed by polling
+        elif self.is_holding and not self.is_left_mouse_button_down():
+            self.is_holding = False
+            self.unhook()
+            self.hook()
+        # If the time elapsed from pressing the button is more than the threshold value,
+        # then the button is considered to be held down
+        return self.is_holding and time.time() - self.hold_start_time >= self.hold_threshold
 
 
 class PlacementManager:
@@ -74,81 +160,154 @@ class PlacementManager:
 
     Attributes:
         all_hwnd (set): Set that stores handles of all detected windows.
+        has_pending_changes (bool): Indicates that registered windows have changed since the last processing.
     """
 
     def __init__(self, settings_manager: SettingsManager):
-        self._settings_manager = settings_manager
+        # the worker shares the settings with the GUI, which can change them while windows are processed,
+        # so a copy taken at the start is used for the whole run
+        self._grid: List[Cell] = deepcopy(settings_manager.grid)
+        """List[Cell]: Copy of the grid cells, the links to the windows are made only in it."""
+
+        self._windows_attributes: List[WindowAttributes] = deepcopy(settings_manager.windows_attributes)
+        """List[WindowAttributes]: Copy of the windows attributes."""
+
+        self._is_using_grid: bool = settings_manager.settings.using_grid
+        """bool: Whether the grid was used when processing was started."""
+
         self._windows_attributes_name: Set[str] = set()
         """Set[str]: Stores the names of processes to be processed."""
 
-        self._windows_attributes_dict: Dict[str, WindowAttributes] = dict()
-        """Dict[str, WindowAttributes]: Maps the name of the process to its WindowAttributes."""
+        self._placement_plans: Dict[str, Tuple[int, int, int, int, bool]] = dict()
+        """Dict[str, Tuple[int, int, int, int, bool]]: Maps the name of the process to the (width, height, x, y,
+        place_at_coordinates) of its WindowAttributes, where place_at_coordinates already accounts for the grid usage."""
 
         self._set_pos_calls: Dict[int, int] = dict()
-        """Dict[int, int]: Maps the window handle to the amount of window sizing calls made."""
+        """Dict[int, int]: Maps the window handle to the amount of window placement at the specified coordinates made."""
 
         self._set_pos_max_count: int = 5
-        """int: Maximum number of size selection calls."""
+        """int: Maximum number of window placements at the specified coordinates."""
 
         self._hwnd_to_cels: Dict[int, Cell] = dict()
         """Dict[int, Cell]: Maps the window handle to its Cell in grid."""
 
-        self._exclude_window_names: Dict[str, Set[str]] = defaultdict(set)
-        """Dict[str, Set[str]]: Maps the name of the process to its exclude window name."""
+        self._cell_xs: List[int] = [cell.x for cell in self._grid]
+        """List[int]: X coordinates of the grid cells, in the same order as the grid."""
+
+        self._cell_ys: List[int] = [cell.y for cell in self._grid]
+        """List[int]: Y coordinates of the grid cells, in the same order as the grid."""
+
+        self._cell_to_idx: Dict[int, int] = {id(cell): idx for idx, cell in enumerate(self._grid)}
+        """Dict[int, int]: Maps the object id of the cell to its index in the grid."""
+
+        self._free_cells: Set[int] = set(self._cell_to_idx.values())
+        """Set[int]: Indexes of cells that are not linked to any window handle."""
+
+        self._free_cells_heap: List[int] = sorted(self._free_cells)
+        """List[int]: Heap of free cell indexes, so the free cell with the highest priority is taken first.
+        It may contain indexes of cells that were linked afterwards, they are skipped when popped."""
+
+        self._cells_per_bucket: int = 2
+        """int: Desired average number of cells in one bucket of the spatial hash."""
+
+        self._buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        """Dict[Tuple[int, int], List[int]]: Spatial hash. Maps the bucket index to indexes of the cells in the grid."""
+
+        self._buckets_per_side: int = 1
+        """int: Number of buckets along each axis."""
+
+        self._bucket_origin: Tuple[int, int] = (0, 0)
+        """Tuple[int, int]: Coordinates of the top left corner of the first bucket."""
+
+        self._bucket_size: Tuple[int, int] = (1, 1)
+        """Tuple[int, int]: Width and height of a bucket."""
+
+        self._build_buckets()
+
+        self._exclude_window_names: Dict[str, FrozenSet[str]] = dict()
+        """Dict[str, FrozenSet[str]]: Maps the name of the process to its exclude window name."""
 
         self._hwnd_to_name: Dict[int, str] = dict()
         """Dict[int, str]: Maps the window handle to the process name."""
 
+        self._hwnd_name_cache: Dict[int, Optional[str]] = dict()
+        """Dict[int, Optional[str]]: Maps the window handle to the process name, or None if the window is ignored."""
+
+        self._hwnd_to_pid: Dict[int, int] = dict()
+        """Dict[int, int]: Maps the window handle to the identifier of its process."""
+
+        self._pid_to_name: Dict[int, Optional[str]] = dict()
+        """Dict[int, Optional[str]]: Maps the process identifier to the process name, or None if it can't be read."""
+
+        self._process_path_buffer: ctypes.Array = ctypes.create_unicode_buffer(PROCESS_PATH_MAX_LENGTH)
+        """ctypes.Array: Buffer for process paths, allocated once and reused for every queried process."""
+
         self.all_hwnd: Set[int] = set()
 
-        for window_attributes in self._settings_manager.windows_attributes:
-            self._windows_attributes_name.add(window_attributes.process_name)
-            self._windows_attributes_dict[window_attributes.process_name] = window_attributes
+        self.has_pending_changes: bool = False
 
-            for exclude_window in window_attributes.exclude_windows:
-                exclude_window: ExcludeWindow
-                self._exclude_window_names[window_attributes.process_name].add(exclude_window.name)
+        for window_attributes in self._windows_attributes:
+            process_name = sys.intern(window_attributes.process_name)
+            self._windows_attributes_name.add(process_name)
+            self._placement_plans[process_name] = (window_attributes.width, window_attributes.height,
+                                                   window_attributes.x, window_attributes.y,
+                                                   window_attributes.use_coordinates and not self.is_using_grid)
+
+            exclude_window_names = frozenset(exclude_window.name for exclude_window in window_attributes.exclude_windows)
+            # the same process may be specified several times
+            self._exclude_window_names[process_name] = \
+                self._exclude_window_names.get(process_name, frozenset()) | exclude_window_names
 
     @property
     def windows_attributes(self) -> List[WindowAttributes]:
-        return self._settings_manager.windows_attributes
+        return self._windows_attributes
 
     @property
     def lookup_names(self) -> Set[str]:
         """Set[str]: Set with the names of the processes we select."""
         return self._windows_attributes_name
 
-    def get_window_attributes(self, process_name: str) -> WindowAttributes:
+    def get_placement_plan(self, process_name: str) -> Tuple[int, int, int, int, bool]:
         """
-        Get WindowAttributes by process name.
+        Get the placement values of WindowAttributes by process name, they are computed once for the whole run.
 
         Args:
             process_name (str): A process name.
         Returns:
-            WindowAttributes: WindowAttributes which is associated with the passed process name.
+            Tuple[int, int, int, int, bool]: (width, height, x, y, place_at_coordinates) of the WindowAttributes
+            which is associated with the passed process name.
         """
-        return self._windows_attributes_dict[process_name]
+        return self._placement_plans[process_name]
 
     def need_set_pos_call(self, hwnd: int) -> bool:
         """
-        Checking whether sizing is necessary.
+        Checking whether placement at the specified coordinates is necessary.
 
         Args:
             hwnd (int): Window handle that needs checking.
         Returns:
-            bool: True if for a window handle needs to call sizing otherwise False.
+            bool: True if for a window handle needs to be placed at the specified coordinates otherwise False.
         """
         return self._set_pos_calls.setdefault(hwnd, 0) < self._set_pos_max_count
 
     def increase_set_pos_call_count(self, hwnd: int):
         """
-        Increased number of sizing calls for a given window handle.
+        Increased number of placements at the specified coordinates for a given window handle.
 
         Args:
-            hwnd (int): Window handle for which the number of sizing calls need to be increased.
+            hwnd (int): Window handle for which the number of placements need to be increased.
         """
         self._set_pos_calls[hwnd] += 1
 
+    def finish_set_pos_calls(self, hwnd: int):
+        """
+        Stopping placements at the specified coordinates for a given window handle, after that the user can move it.
+
+        Args:
+            hwnd (int): Window handle that is already at the specified coordinates.
+        """
+        self._set_pos_calls[hwnd] = self._set_pos_max_count
+
     def is_exclude_window(self, proc_name: str, window_name: str) -> bool:
         """
         Checking whether the window name is excluded from processing.
@@ -159,12 +318,12 @@ class PlacementManager:
         Returns:
             True, if the gotten window name is to be excluded from processing otherwise False.
         """
-        return window_name in self._exclude_window_names[proc_name]
+        return window_name in self._exclude_window_names.get(proc_name, ())
 
     @property
     def is_using_grid(self) -> bool:
         """bool: True if you need to use grid window placement otherwise False"""
-        return self._settings_manager.settings.using_grid
+        return self._is_using_grid
 
     def link_cell(self, hwnd: int, cell: Cell):
         """
@@ -176,6 +335,7 @@ class PlacementManager:
         """
         cell.hwnd = hwnd
         self._hwnd_to_cels[hwnd] = cell
+        self._free_cells.discard(self._cell_to_idx[id(cell)])
 
     def unlink_cell(self, hwnd: int, cell: Cell):
         """
@@ -189,24 +349,36 @@ class PlacementManager:
         if hwnd in self._hwnd_to_cels:
             del self._hwnd_to_cels[hwnd]
 
-    def get_cell(self, hwnd: int) -> Optional[Cell]:
+        cell_idx = self._cell_to_idx[id(cell)]
+        if cell_idx not in self._free_cells:
+            self._free_cells.add(cell_idx)
+            heapq.heappush(self._free_cells_heap, cell_idx)
+
+    def get_linked_cell(self, hwnd: int) -> Optional[Cell]:
         """
-        Getting a grid cell for a given window handle.
+        Getting a grid cell that is already linked to a given window handle.
 
         Args:
             hwnd (int): Window handle, for which a cell is needed.
         Return:
-            Сell if available, otherwise None.
+            Сell if the window handle has been assigned to a cell, otherwise None.
         """
-        # If the given window handle has already been assigned to a cell, return it
-        if hwnd in self._hwnd_to_cels:
-            return self._hwnd_to_cels[hwnd]
+        return self._hwnd_to_cels.get(hwnd)
+
+    def assign_cell(self, hwnd: int) -> Optional[Cell]:
+        """
+        Linking a free grid cell to a given window handle.
 
-        # free cell search
-        for cell in self._settings_manager.grid:
-            # If a cell belonged to some window handle, but now it is no longer in the all_hwnd
-            # it means that this window was closed, and it is possible to select the vacated cell
-            if cell.hwnd not in self.all_hwnd:
+        Args:
+            hwnd (int): Window handle, for which a cell is needed.
+        Return:
+            Сell if available, otherwise None.
+        """
+        # taking the first free cell in the grid, the cells are unlinked when their windows are closed
+        while self._free_cells_heap:
+            cell_idx = heapq.heappop(self._free_cells_heap)
+            if cell_idx in self._free_cells:
+                cell = self._grid[cell_idx]
                 self.link_cell(hwnd, cell)
                 return cell
 
@@ -222,15 +394,99 @@ class PlacementManager:
         Returns:
             Cell that is near the given coordinates.
         """
-        cur_cell: Cell = self._settings_manager.grid[0]
-        # Finding the minimum by Euclidean norm
-        min_distance = sqrt((x - cur_cell.x) ** 2 + (y - cur_cell.y) ** 2)
-        for cell in self._settings_manager.grid:
-            cur_distance = sqrt((x - cell.x) ** 2 + (y - cell.y) ** 2)
-            if cur_distance < min_distance:
-                min_distance = cur_distance
-                cur_cell = cell
-        return cur_cell
+        bucket_x, bucket_y = self._get_bucket_idx(x, y)
+        # local names are faster to access in the inner loop than attributes
+        buckets, cell_xs, cell_ys = self._buckets, self._cell_xs, self._cell_ys
+        # Squared Euclidean norm has the same minimum as the norm itself
+        best_distance = -1
+        best_idx = 0
+        # look through the rings of buckets around the bucket of the given coordinates,
+        # until the cells in the next ring are guaranteed to be farther than the found one
+        for ring in range(self._buckets_per_side):
+            if best_distance >= 0:
+                ring_min_distance = self._get_ring_min_distance(x, y, bucket_x, bucket_y, ring)
+                if ring_min_distance * ring_min_distance > best_distance:
+                    break
+            for bucket in self._get_ring_buckets(bucket_x, bucket_y, ring):
+                for idx in buckets.get(bucket, ()):
+                    dx = x - cell_xs[idx]
+                    dy = y - cell_ys[idx]
+                    distance = dx * dx + dy * dy
+                    # the cell that comes first in the grid wins among equidistant ones
+                    if best_distance < 0 or distance < best_distance or (distance == best_distance and idx < best_idx):
+                        best_distance = distance
+                        best_idx = idx
+        return self._grid[best_idx]
+
+    def _build_buckets(self):
+        """Distribute the grid cells over the buckets of the spatial hash."""
+        if len(self._cell_xs) == 0:
+            return
+        min_x, min_y = min(self._cell_xs), min(self._cell_ys)
+        self._buckets_per_side = max(1, round(sqrt(len(self._cell_xs) / self._cells_per_bucket)))
+        self._bucket_origin = (min_x, min_y)
+        self._bucket_size = ((max(self._cell_xs) - min_x) // self._buckets_per_side + 1,
+                             (max(self._cell_ys) - min_y) // self._buckets_per_side + 1)
+        for idx in range(len(self._cell_xs)):
+            self._buckets[self._get_bucket_idx(self._cell_xs[idx], self._cell_ys[idx])].append(idx)
+
+    def _get_bucket_idx(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        Getting the index of the bucket containing the given coordinates.
+
+        Args:
+             x (int): Position by x
+             y (int): Position by y
+        Returns:
+            Bucket index. Coordinates outside the grid are clamped to the nearest bucket.
+        """
+        last = self._buckets_per_side - 1
+        return (min(max((x - self._bucket_origin[0]) // self._bucket_size[0], 0), last),
+                min(max((y - self._bucket_origin[1]) // self._bucket_size[1], 0), last))
+
+    def _get_ring_buckets(self, bucket_x: int, bucket_y: int, ring: int) -> List[Tuple[int, int]]:
+        """
+        Getting the indexes of the buckets that are exactly at the given distance from the given bucket.
+
+        Args:
+            bucket_x (int): Bucket index by x.
+            bucket_y (int): Bucket index by y.
+            ring (int): Distance in buckets.
+        Returns:
+            List of bucket indexes.
+        """
+        if ring == 0:
+            return [(bucket_x, bucket_y)]
+        buckets = []
+        for i in range(-ring, ring + 1):
+            buckets.append((bucket_x + i, bucket_y - ring))
+            buckets.append((bucket_x + i, bucket_y + ring))
+        for i in range(-ring + 1, ring):
+            buckets.append((bucket_x - ring, bucket_y + i))
+            buckets.append((bucket_x + ring, bucket_y + i))
+        return buckets
+
+    def _get_ring_min_distance(self, x: int, y: int, bucket_x: int, bucket_y: int, ring: int) -> int:
+        """
+        Getting the lower bound of the distance from the given coordinates to the cells in the ring of buckets.
+
+        Args:
+            x (int): Position by x
+            y (int): Position by y
+            bucket_x (int): Index by x of the bucket in the ring center.
+            bucket_y (int): Index by y of the bucket in the ring center.
+            ring (int): Distance in buckets.
+        Returns:
+            Lower bound of the distance.
+        """
+        # the cells of the ring are outside the box formed by the inner rings
+        left = self._bucket_origin[0] + (bucket_x - ring + 1) * self._bucket_size[0]
+        right = self._bucket_origin[0] + (bucket_x + ring) * self._bucket_size[0]
+        top = self._bucket_origin[1] + (bucket_y - ring + 1) * self._bucket_size[1]
+        bottom = self._bucket_origin[1] + (bucket_y + ring) * self._bucket_size[1]
+        if not (left <= x < right and top <= y < bottom):
+            return 0
+        return min(x - left, right - x, y - top, bottom - y)
 
     def move_to_cell(self, hwnd: int, dest_cell: Cell):
         """
@@ -243,12 +499,12 @@ class PlacementManager:
         if dest_cell.hwnd == hwnd:
             return
 
-        curr_cell = self.get_cell(hwnd)
+        curr_cell = self.get_linked_cell(hwnd) or self.assign_cell(hwnd)
         if curr_cell:
             if curr_cell.x == dest_cell.x and curr_cell.y == dest_cell.y:
                 return
             else:
-                curr_cell.hwnd = 0
+                self.unlink_cell(hwnd, curr_cell)
         # if the destination cell is empty
         if dest_cell.hwnd == 0:
             self.link_cell(hwnd, dest_cell)
@@ -270,6 +526,19 @@ class PlacementManager:
             process_name (str): Process name to be bound.
         """
         self._hwnd_to_name[hwnd] = process_name
+        self.has_pending_changes = True
+
+    def unregister_process(self, hwnd: int):
+        """
+        Removes the mapping of a window handle to its process name and frees its cell.
+
+        Args:
+            hwnd (int): Window handle to be unregistered.
+        """
+        self._hwnd_to_name.pop(hwnd, None)
+        cell = self._hwnd_to_cels.get(hwnd)
+        if cell:
+            self.unlink_cell(hwnd, cell)
 
     def registered_processes_iter(self) -> ItemsView[int, str]:
         """
@@ -292,10 +561,190 @@ class PlacementManager:
         """
         return hwnd in self._hwnd_to_name
 
-    def reset(self):
-        """Resetting the internal state."""
-        self.all_hwnd.clear()
-        self._hwnd_to_name.clear()
+    def is_cached_hwnd(self, hwnd: int) -> bool:
+        """
+        Checking whether the process name of a window handle has already been resolved.
+
+        Args:
+            hwnd (int): Window handle to be checked.
+
+        Returns:
+            True if the window handle is in the process name cache otherwise False.
+        """
+        return hwnd in self._hwnd_name_cache
+
+    def get_cached_process_name(self, hwnd: int) -> Optional[str]:
+        """
+        Getting the cached process name of a window handle.
+
+        Args:
+            hwnd (int): Window handle whose process name is needed.
+
+        Returns:
+            Process name if the window is to be processed, otherwise None.
+        """
+        return self._hwnd_name_cache.get(hwnd)
+
+    def cache_process_name(self, hwnd: int, process_name: Optional[str]):
+        """
+        Save the resolved process name of a window handle.
+
+        Args:
+            hwnd (int): Window handle to which the process name belongs.
+            process_name (Optional[str]): Process name, or None if the window is to be ignored.
+        """
+        self._hwnd_name_cache[hwnd] = process_name
+
+    def resolve_process_name(self, hwnd: int, process_id: int) -> Optional[str]:
+        """
+        Getting the process name of a window, the process is queried only for the first window of each process.
+
+        Args:
+            hwnd (int): Window handle owned by the process.
+            process_id (int): Identifier of the process whose name is needed.
+
+        Returns:
+            Process name if the process could be opened, otherwise None.
+        """
+        self._hwnd_to_pid[hwnd] = process_id
+        if process_id not in self._pid_to_name:
+            self._pid_to_name[process_id] = query_process_name(process_id, self._process_path_buffer)
+        return self._pid_to_name[process_id]
+
+    def forget_window(self, hwnd: int, is_destroyed: bool):
+        """
+        Removing a window that is no longer displayed from all structures.
+
+        Args:
+            hwnd (int): Window handle to be removed.
+            is_destroyed (bool): Whether the window was destroyed, and not just hidden.
+        """
+        self.all_hwnd.discard(hwnd)
+        self.unregister_process(hwnd)
+        # the window handle may be reused by another process after the window is destroyed
+        if is_destroyed:
+            self._hwnd_name_cache.pop(hwnd, None)
+            self._set_pos_calls.pop(hwnd, None)
+            # the process may have exited, and its identifier may be reused too
+            self._pid_to_name.pop(self._hwnd_to_pid.pop(hwnd, None), None)
+
+
+class WindowEventTracker:
+    """
+    Class that keeps the PlacementManager up to date using Win32 window event hooks instead of polling.
+    """
+
+    def __init__(self, placement_manager: PlacementManager):
+        self._placement_manager = placement_manager
+        self._callback = WinEventProcType(self._handle_event)
+        """WinEventProcType: Hook callback. A reference must be kept while the hooks are installed."""
+
+        self._hooks: List[int] = []
+        """List[int]: Handles of the installed hooks."""
+
+        self._msg = wintypes.MSG()
+        """MSG: Buffer for messages received by the message pump."""
+
+    def hook(self):
+        """Install hooks for window events."""
+        user32 = ctypes.windll.user32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProcType,
+                                           wintypes.DWORD, wintypes.DWORD, wintypes.DWORD)
+        for event_min, event_max in ((EVENT_SYSTEM_MOVESIZEEND, EVENT_SYSTEM_MOVESIZEEND),
+                                     (EVENT_OBJECT_DESTROY, EVENT_OBJECT_NAMECHANGE)):
+            hook = user32.SetWinEventHook(event_min, event_max, None, self._callback, 0, 0,
+                                          WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS)
+            if hook:
+                self._hooks.append(hook)
+
+    def unhook(self):
+        """Remove all installed hooks."""
+        for hook in self._hooks:
+            ctypes.windll.user32.UnhookWinEvent(wintypes.HANDLE(hook))
+        self._hooks.clear()
+
+    def pump_messages(self):
+        """Dispatch all pending messages of the thread, which calls the hook callback for each received event."""
+        user32 = ctypes.windll.user32
+        msg_ref = ctypes.byref(self._msg)
+        while user32.PeekMessageW(msg_ref, None, 0, 0, PM_REMOVE):
+            user32.TranslateMessage(msg_ref)
+            user32.DispatchMessageW(msg_ref)
+
+    def wait_messages(self, timeout: float):
+        """
+        Wait until a message arrives in the thread queue or the timeout expires.
+
+        Args:
+            timeout (float): Maximum waiting time in seconds.
+        """
+        ctypes.windll.user32.MsgWaitForMultipleObjectsEx(0, None, int(timeout * 1000), QS_ALLINPUT,
+                                                          MWMO_INPUTAVAILABLE)
+
+    def _handle_event(self, hook, event: int, hwnd: Optional[int], id_object: int, id_child: int,
+                      event_thread: int, event_time: int):
+        # only events of the windows themselves are needed, not of their parts
+        if not hwnd or id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+
+        if event == EVENT_OBJECT_DESTROY or event == EVENT_OBJECT_HIDE:
+            self._placement_manager.forget_window(hwnd, event == EVENT_OBJECT_DESTROY)
+        elif event == EVENT_OBJECT_SHOW:
+            if ctypes.windll.user32.GetAncestor(hwnd, GA_PARENT) == ctypes.windll.user32.GetDesktopWindow():
+                winEnumHandler(hwnd, self._placement_manager)
+        elif event == EVENT_OBJECT_NAMECHANGE:
+            if hwnd in self._placement_manager.all_hwnd:
+                winEnumHandler(hwnd, self._placement_manager)
+        elif event == EVENT_OBJECT_LOCATIONCHANGE:
+            if self._placement_manager.is_registered_hwnd(hwnd):
+                self._placement_manager.has_pending_changes = True
+        elif event == EVENT_SYSTEM_MOVESIZEEND:
+            processing_window_change_pos(self._placement_manager, hwnd)
+
+
+def query_process_name(process_id: int, buffer: ctypes.Array) -> Optional[str]:
+    """
+    Getting the name of the process executable.
+
+    Args:
+        process_id (int): Identifier of the process whose name is needed.
+        buffer (ctypes.Array): Unicode buffer of PROCESS_PATH_MAX_LENGTH characters for the process path,
+            it is reused between calls.
+    Returns:
+        Process name if the process could be opened, otherwise None.
+    """
+    handle = OpenProcess(win32con.PROCESS_QUERY_LIMITED_INFORMATION, False, process_id)
+    if not handle:
+        return None
+
+    size = wintypes.DWORD(PROCESS_PATH_MAX_LENGTH)
+    try:
+        # information about where the process is located
+        if not QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return None
+    finally:
+        CloseHandle(handle)
+
+    # the path is always absolute, so the name is what follows the last separator, no Path object is needed.
+    # Interning makes the name share the hash with other names of the same process.
+    # The buffer may contain the rest of a longer path from a previous call, so only the written part is read.
+    return sys.intern(buffer[:size.value].rsplit("\\", 1)[-1])
+
+
+def is_app_window(hwnd: int) -> bool:
+    """
+    Checking whether the window is an application window, the same way the taskbar and Alt+Tab do it.
+
+    Args:
+        hwnd (int): Window handle to be checked.
+    Returns:
+        True if the window is an application window, False if it is a tool window or is owned by another window.
+    """
+    ex_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+    if ex_style & win32con.WS_EX_APPWINDOW:
+        return True
+    return not ex_style & win32con.WS_EX_TOOLWINDOW and not win32gui.GetWindow(hwnd, win32con.GW_OWNER)
 
 
 def winEnumHandler(hwnd: int, placement_manager: PlacementManager):
@@ -308,24 +757,30 @@ def winEnumHandler(hwnd: int, placement_manager: PlacementManager):
     """
     if win32gui.IsWindowVisible(hwnd):
         placement_manager.all_hwnd.add(hwnd)
-        window_name: str = win32gui.GetWindowText(hwnd)
-        threadId, processId = win32process.GetWindowThreadProcessId(hwnd)
 
-        handle = None
-        try:
-            handle = win32api.OpenProcess(win32con.PROCESS_QUERY_LIMITED_INFORMATION, False, processId)
-        except Exception as e:
-            pass
-
-        if handle is None:
+        # the process name is resolved only once per window handle, since it is an expensive call
+        if placement_manager.is_cached_hwnd(hwnd):
+            proc_name = placement_manager.get_cached_process_name(hwnd)
+        else:
+            proc_name = None
+            # windows of the desktop and the taskbar, tool windows and dialogs are never processed,
+            # so their process is not queried
+            if is_app_window(hwnd) and win32gui.GetClassName(hwnd) not in IGNORED_WINDOW_CLASSES:
+                thread_id, process_id = win32process.GetWindowThreadProcessId(hwnd)
+                proc_name = placement_manager.resolve_process_name(hwnd, process_id)
+            if proc_name not in placement_manager.lookup_names:
+                proc_name = None
+            placement_manager.cache_process_name(hwnd, proc_name)
+
+        if proc_name is None:
             return
 
-        proc_path: str = win32process.GetModuleFileNameEx(handle, 0)  # information about where the process is located
-
-        proc_name = str(Path(proc_path).name)
-        if proc_name in placement_manager.lookup_names and not placement_manager.is_exclude_window(proc_name,
-                                                                                                   window_name):
+        window_name: str = win32gui.GetWindowText(hwnd)
+        if not placement_manager.is_exclude_window(proc_name, window_name):
             placement_manager.register_process(hwnd, proc_name)
+        # the window title may have changed to an excluded one
+        else:
+            placement_manager.unregister_process(hwnd)
 
 
 def processing_detected_windows(placement_manager: PlacementManager):
@@ -335,127 +790,154 @@ def processing_detected_windows(placement_manager: PlacementManager):
     Args:
         placement_manager (PlacementManager): Instance of PlacementManager which contains information on the window to be processed.
     """
-    # This call allows you to ignore dpi so that window sizes do not depend on it
-    ctypes.windll.shcore.SetProcessDpiAwareness(2)
-    for hwnd, proc_name in placement_manager.registered_processes_iter():
-        window_attributes = placement_manager.get_window_attributes(proc_name)
-
-        if placement_manager.need_set_pos_call(hwnd):
-            move_window = win32con.SWP_NOMOVE
-            if window_attributes.use_coordinates and not placement_manager.is_using_grid:
-                move_window = win32con.SWP_SHOWWINDOW
-
-            win32gui.SetWindowPos(hwnd, win32con.HWND_NOTOPMOST, window_attributes.x, window_attributes.y,
-                                  window_attributes.width, window_attributes.height, move_window)
-            placement_manager.increase_set_pos_call_count(hwnd)
+    placement_manager.has_pending_changes = False
+    # one buffer is reused for all windows
+    rect = wintypes.RECT()
+    rect_ref = ctypes.byref(rect)
+    is_using_grid = placement_manager.is_using_grid
+    # copy, since the window event hooks can change registered windows while Win32 calls are in progress
+    for hwnd, proc_name in list(placement_manager.registered_processes_iter()):
+        width, height, x, y, place_at_coordinates = placement_manager.get_placement_plan(proc_name)
 
-        rect = ctypes.wintypes.RECT()
         # this call allows you to get the size of the window
         # (this size is different from the size obtained with GetWindowRect)
-        hresult = ctypes.windll.dwmapi.DwmGetWindowAttribute(hwnd,
-                                                             DWMWA_EXTENDED_FRAME_BOUNDS,
-                                                             ctypes.byref(rect),
-                                                             ctypes.sizeof(rect)
-                                                             )
+        hresult = DwmGetWindowAttribute(hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, rect_ref, RECT_SIZE)
+        # the window may already be closed, and the buffer then contains the size of the previous window
+        if hresult != 0:
+            continue
         rect_width = rect.right - rect.left
         rect_height = rect.bottom - rect.top
 
-        is_correct_width = rect_width == window_attributes.width
-        is_correct_height = rect_height == window_attributes.height
-        # if the width or height differs from the specified width or height, we calculate the added value
-        if not is_correct_width:
-            window_attributes.additional_width = window_attributes.width - rect_width
-            window_attributes.additional_width = window_attributes.additional_width if window_attributes.additional_width > 0 else 0
-        if not is_correct_height:
-            window_attributes.additional_height = window_attributes.height - rect_height
-            window_attributes.additional_height = window_attributes.additional_height if window_attributes.additional_height > 0 else 0
-
-        current_left = window_attributes.x
-        current_top = window_attributes.y
-
         # there may be a situation where the window is already closed
         try:
-            current_left, current_top, _, _ = win32gui.GetWindowRect(hwnd)
+            current_left, current_top, current_right, current_bottom = win32gui.GetWindowRect(hwnd)
         except Exception as e:
             continue
 
+        # the window rect includes invisible borders around the visible frame, they have to be added to the size,
+        # so that a single call is enough to get the visible frame of the specified size
+        additional_width = max(current_right - current_left - rect_width, 0)
+        additional_height = max(current_bottom - current_top - rect_height, 0)
+
+        is_correct_width = rect_width == width
+        is_correct_height = rect_height == height
+
         move_window = win32con.SWP_NOMOVE
-        left = window_attributes.x
-        top = window_attributes.y
+        left = x
+        top = y
         is_correct_left = True
         is_correct_top = True
-        if placement_manager.is_using_grid:
-            cell = placement_manager.get_cell(hwnd)
+        if is_using_grid:
+            # a free cell is searched only for windows that have not been assigned to a cell yet
+            cell = placement_manager.get_linked_cell(hwnd) or placement_manager.assign_cell(hwnd)
             if cell:
                 left = cell.x
                 top = cell.y
                 is_correct_left = current_left == cell.x
                 is_correct_top = current_top == cell.y
                 move_window = win32con.SWP_SHOWWINDOW
+        # without the grid, the window is placed at the specified coordinates only the first few times,
+        # after that the user can move it
+        elif place_at_coordinates and placement_manager.need_set_pos_call(hwnd):
+            is_correct_left = current_left == x
+            is_correct_top = current_top == y
+            # passes are made only after location changes, so the user moves would also be counted and reverted
+            # if the counting continued after the window has reached the coordinates
+            if is_correct_left and is_correct_top:
+                placement_manager.finish_set_pos_calls(hwnd)
+            else:
+                move_window = win32con.SWP_SHOWWINDOW
+                placement_manager.increase_set_pos_call_count(hwnd)
 
         if not is_correct_width or not is_correct_height or not is_correct_left or not is_correct_top:
-            width = window_attributes.width + window_attributes.additional_width
-            height = window_attributes.height + window_attributes.additional_height
-            win32gui.SetWindowPos(hwnd, win32con.HWND_NOTOPMOST, left, top, width, height, move_window)
-
-
-def processing_window_change_pos(placement_manger: PlacementManager):
+            # the asynchronous call does not wait until the window of another process handles the change,
+            # so a hung window does not block the thread
+            try:
+                win32gui.SetWindowPos(hwnd, win32con.HWND_NOTOPMOST, left, top, width + additional_width,
+                                      height + additional_height,
+                                      move_window | SET_POS_FLAGS | win32con.SWP_ASYNCWINDOWPOS)
+            # there may be a situation where the window is already closed
+            except Exception as e:
+                continue
+
+
+def processing_window_change_pos(placement_manger: PlacementManager, hwnd: int):
     """
     Processing of window position changes.
 
     Args:
         placement_manger (PlacementManager): Instance of PlacementManager containing information about where the window should be placed.
+        hwnd (int): Window handle that has been moved.
     """
-    cur_pos_x, cur_pos_y = win32api.GetCursorPos()
-    cur_window_hwnd = win32gui.WindowFromPoint((cur_pos_x, cur_pos_y))
-
-    if not placement_manger.is_registered_hwnd(cur_window_hwnd) or not placement_manger.is_using_grid:
+    if not placement_manger.is_registered_hwnd(hwnd) or not placement_manger.is_using_grid:
         return
 
-    current_left = cur_pos_x
-    current_top = cur_pos_y
-
     # there may be a situation where the window is already closed
     try:
-        current_left, current_top, _, _ = win32gui.GetWindowRect(cur_window_hwnd)
+        current_left, current_top, _, _ = win32gui.GetWindowRect(hwnd)
     except Exception as e:
         return
 
     cell = placement_manger.search_nearest_cell(current_left, current_top)
-    placement_manger.move_to_cell(cur_window_hwnd, cell)
+    placement_manger.move_to_cell(hwnd, cell)
+    placement_manger.has_pending_changes = True
 
 
 def resize_window(setting_manager: SettingsManager):
     """
-    Function that continuously processes windows depending on the mouse state.
+    Function that processes windows when they are changed, depending on the mouse state.
 
     Args:
         setting_manager (SettingsManager): Instance of SettingsManager which contains information on where and how the windows should be placed
     """
+    # This call allows you to ignore dpi so that window sizes do not depend on it.
+    # Only this thread is made DPI aware, so that the GUI running in the same process is not affected
+    try:
+        ctypes.windll.user32.SetThreadDpiAwarenessContext(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE)
+    # Windows versions before 10 (1607) can only change it for the whole process
+    except AttributeError:
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)
     placement_manager = PlacementManager(setting_manager)
     mouse_tracker = MouseTracker(0.1)
-    # Indicator of whether the left mouse button has been held down before
-    prev_is_hold = False
-    while setting_manager.is_running:
-        win32gui.EnumWindows(winEnumHandler, placement_manager)
-        is_hold = mouse_tracker.is_left_mouse_button_hold()
-        if not prev_is_hold and not is_hold:
-            processing_detected_windows(placement_manager)
-        # make window positioning when the user left mouse button is up
-        if prev_is_hold and not is_hold:
-            processing_window_change_pos(placement_manager)
-
-        prev_is_hold = is_hold
-        placement_manager.reset()
-
-
-def processing_start(settings_manager: SettingsManager):
+    mouse_tracker.hook()
+    window_event_tracker = WindowEventTracker(placement_manager)
+    window_event_tracker.hook()
+    # windows that existed before the hooks were installed are detected only once
+    win32gui.EnumWindows(winEnumHandler, placement_manager)
+    # timeouts of waiting for messages in seconds, the idle one only limits the reaction time to the stop request
+    active_interval = 0.016
+    idle_interval = 0.1
+    interval = idle_interval
+    try:
+        while setting_manager.is_running:
+            window_event_tracker.wait_messages(interval)
+            window_event_tracker.pump_messages()
+            # windows are not processed while the user is dragging them
+            if placement_manager.has_pending_changes and not mouse_tracker.is_left_mouse_button_hold():
+                processing_detected_windows(placement_manager)
+            # if the changes are postponed, the mouse state must be checked again soon
+            interval = active_interval if placement_manager.has_pending_changes else idle_interval
+    finally:
+        window_event_tracker.unhook()
+        mouse_tracker.unhook()
+
+
+def processing_start(settings_manager: SettingsManager, isolated: bool = False) -> Union[Thread, BaseProcess]:
     """
-    Function to start the process in which windows will be processed.
+    Function to start the thread in which windows will be processed.
 
     Args:
         settings_manager (SettingsManager): Instance of SettingsManager which contains information on where and how the windows should be placed
+        isolated (bool): Whether to process windows in a separate process instead of a thread.
+    Returns:
+        Started thread or process.
     """
-    mp_context = get_context('spawn')
-    p = mp_context.Process(target=resize_window, args=(settings_manager,), daemon=True)
-    p.start()
+    # the work consists of Win32 calls that release the GIL, so a thread does not slow down the GUI
+    # and does not need a second interpreter
+    if isolated:
+        mp_context = get_context('spawn')
+        worker = mp_context.Process(target=resize_window, args=(settings_manager,), daemon=True)
+    else:
+        worker = Thread(target=resize_window, args=(settings_manager,), daemon=True)
+    worker.start()
+    return worker
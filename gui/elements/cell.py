@@ -1,8 +1,8 @@
 from tkinter import Label, Entry, Event
-from typing import List
+from typing import List, Callable, Optional
 
 from gui.elements.editing_control import HorizontalButtons
-from gui.validators import is_positive_number
+from gui.validators import get_number_validator
 from settings import Cell
 
 
@@ -15,6 +15,7 @@ class CellElement:
         cells_list (List[Cell]): List of all cells.
         cell_idx (int): Index of the cell to be viewed.
         cell (Cell): Current open cell.
+        is_saved (bool): Indicates whether the cell was saved before the window was closed.
         x_label: Label in front of the field for entering X coordinate.
         x_entry: Field for entering the X coordinate.
         y_label: Label in front of the field for entering Y coordinate.
@@ -22,7 +23,8 @@ class CellElement:
         editing_control_buttons (HorizontalButtons): Buttons to control the editing process.
     """
 
-    def __init__(self, master, cells_list: List[Cell], cell_idx: int):
+    def __init__(self, master, cells_list: List[Cell], cell_idx: int,
+                 on_exit: Optional[Callable[["CellElement"], None]] = None):
         """
         Construct a window for viewing cell attributes.
 
@@ -30,29 +32,23 @@ class CellElement:
             master: Parent window.
             cells_list (List[Cell]): List of all cells.
             cell_idx (int): Index of the cell to be viewed.
+            on_exit (:obj:`Callable`, optional): Called with this element after the window is hidden. Defaults to None.
         """
         self.master = master
-        self.cells_list = cells_list
-        self.cell_idx = cell_idx
+        self._on_exit = on_exit
 
-        self._number_validator = self.master.register(is_positive_number)
-
-        self.cell = Cell()
-        if self.cell_idx >= 0:
-            self.cell = self.cells_list[self.cell_idx]
+        self._number_validator = get_number_validator(self.master)
 
         self.x_label: Label = Label(master, text="X")
         self.x_label.grid(column=0, row=0, sticky="nw", pady=(10, 0), padx=(5, 0))
 
         self.x_entry: Entry = Entry(master, width=15, validate="key", validatecommand=(self._number_validator, "%P"))
-        self.x_entry.insert(0, str(self.cell.x))
         self.x_entry.grid(column=0, row=1, padx=(5, 0))
 
         self.y_label: Label = Label(master, text="Y")
         self.y_label.grid(column=1, row=0, sticky="nw", pady=(10, 0), padx=(15, 0))
 
         self.y_entry: Entry = Entry(master, width=15, validate="key", validatecommand=(self._number_validator, "%P"))
-        self.y_entry.insert(0, str(self.cell.y))
         self.y_entry.grid(column=1, row=1, padx=(15, 0))
 
         self.editing_control_buttons = HorizontalButtons(master, 2)
@@ -61,6 +57,31 @@ class CellElement:
         self.editing_control_buttons.configure_button(0, text="Save", command=self.save_cell)
         self.editing_control_buttons.configure_button(1, text="Exit", command=self.exit)
 
+        # the window is hidden instead of being destroyed so that it can be reused for the next cell
+        self.master.protocol("WM_DELETE_WINDOW", self.exit)
+        self.reset(cells_list, cell_idx)
+
+    def reset(self, cells_list: List[Cell], cell_idx: int):
+        """
+        Filling the existing fields with the attributes of another cell.
+
+        Args:
+            cells_list (List[Cell]): List of all cells.
+            cell_idx (int): Index of the cell to be viewed.
+        """
+        self.cells_list = cells_list
+        self.cell_idx = cell_idx
+        self.is_saved: bool = False
+
+        self.cell = Cell()
+        if self.cell_idx >= 0:
+            self.cell = self.cells_list[self.cell_idx]
+
+        self.x_entry.delete(0, "end")
+        self.x_entry.insert(0, str(self.cell.x))
+        self.y_entry.delete(0, "end")
+        self.y_entry.insert(0, str(self.cell.y))
+
     def save_cell(self, event: Event = None):
         """
         Saving values from interface fields to Cell instance fields.
@@ -76,14 +97,16 @@ class CellElement:
                 self.cell.id = self.cells_list[-1].id + 1
             self.cells_list.append(self.cell)
 
+        self.is_saved = True
         self.exit()
 
     def exit(self, event: Event = None):
         """
-        Closing the master window.
+        Hiding the master window.
 
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        self.master.destroy()
-        self.master.update()
+        self.master.withdraw()
+        if self._on_exit is not None:
+            self._on_exit(self)
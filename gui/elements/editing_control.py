@@ -1,5 +1,5 @@
 from tkinter import Frame, Button
-from typing import List
+from typing import Tuple
 
 
 class HorizontalButtons:
@@ -23,16 +23,13 @@ class HorizontalButtons:
         if count <= 0:
             raise ValueError("Number of buttons must be a positive number.")
         self.button_frame: Frame = Frame(master)
-        self._button_list: List[Button] = []
-        """list: List of all created buttons"""
+        self._button_list: Tuple[Button, ...] = tuple(Button(self.button_frame) for _ in range(count))
+        """tuple: All created buttons"""
 
-        # setup buttons
-        for i in range(count):
+        # setup buttons, the first one has no left padding
+        for i, button in enumerate(self._button_list):
             self.button_frame.columnconfigure(index=i, weight=2)
-            self._button_list.append(Button(self.button_frame))
-            self._button_list[i].grid(column=i, row=0, sticky="we", padx=(10, 0))
-
-        self._button_list[0].grid(column=0, row=0, sticky="we", padx=0)
+            button.grid(column=i, row=0, sticky="we", padx=(10, 0) if i else 0)
 
     def frame_grid(self, **kwargs):
         """
@@ -52,3 +49,15 @@ class HorizontalButtons:
             **kwargs: Arbitrary keyword arguments.
         """
         self._button_list[idx].configure(**kwargs)
+
+    def get_state_script(self, idx: int, state: str) -> str:
+        """
+        Builds a Tcl script that sets the state of the specified button, so it can be run together with other commands.
+
+        Args:
+            idx (int): number of the button.
+            state (str): State of the button, "normal" or "disabled".
+        Returns:
+            Tcl script.
+        """
+        return f"{self._button_list[idx]} configure -state {state}"
@@ -14,6 +14,7 @@ class ExcludeWindowElement:
         exclude_windows_list (List[ExcludeWindow]): List of all exclude windows.
         exclude_window_idx (int): Index of the exclude window to be viewed.
         exclude_window (ExcludeWindow): Current open exclude window.
+        is_saved (bool): Indicates whether the exclude window was saved before the window was closed.
         window_name_label: Label in front of the field for entering name of excluded window.
         window_name_entry: Field for entering the name of excluded window.
         editing_control_buttons (HorizontalButtons): Buttons to control the editing process.
@@ -32,6 +33,7 @@ class ExcludeWindowElement:
         self.exclude_windows_list = exclude_windows_list
         self.exclude_window_idx = exclude_window_idx
         self.exclude_window = ExcludeWindow()
+        self.is_saved: bool = False
 
         if exclude_window_idx >= 0:
             self.exclude_window = self.exclude_windows_list[self.exclude_window_idx]
@@ -56,13 +58,16 @@ class ExcludeWindowElement:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
+        # the exclude window taken when the window was opened is edited, the list may have changed since then
         if self.exclude_window_idx >= 0:
-            exclude_window = self.exclude_windows_list[self.exclude_window_idx]
+            exclude_window = self.exclude_window
             exclude_window.name = self.window_name_entry.get()
         else:
             exclude_window_name = self.window_name_entry.get()
             exclude_window = ExcludeWindow(name=exclude_window_name)
             self.exclude_windows_list.append(exclude_window)
+        self.exclude_window = exclude_window
+        self.is_saved = True
         self.exit()
 
     def exit(self, event: Event = None):
@@ -1,9 +1,15 @@
-from tkinter import Frame, Variable, Label, Listbox, Scrollbar, Event, messagebox, Toplevel, IntVar, Checkbutton
+from functools import partial
+from operator import methodcaller
+from tkinter import Frame, Label, Listbox, Scrollbar, Event, Toplevel, IntVar, Checkbutton
+from typing import Optional
 
 from gui.elements.cell import CellElement
 from gui.elements.list_control import ListControlButtons
+from gui.elements.status_label import StatusLabel
 from settings import SettingsManager
 
+_get_coords_str = methodcaller("get_coords_str")
+
 
 class GridTabWindow:
     """
@@ -14,11 +20,11 @@ class GridTabWindow:
         frame: Frame that will contain all elements.
         is_use_grid: Field indicating whether the grid will be used or not.
         use_grid_check: Checkbox that represents the state of the is_use_grid field.
-        cells_var: Field representing the list of cell coordinates.
         cells_label: Label in front of listbox displaying grid cells.
         cells_listbox: Listbox that displays grid cells.
         cells_scrollbar: Scrollbar to scroll through the list of grid cells.
         list_control_button (ListControlButtons): Buttons that let manage the cells in the list.
+        status_label (StatusLabel): Label that shows messages about user actions.
     """
 
     def __init__(self, master, settings_manager: SettingsManager):
@@ -31,6 +37,13 @@ class GridTabWindow:
         """
         self.master = master
         self._settings_manager = settings_manager
+        self._visible_after_id: Optional[str] = None
+        self._is_list_visible: bool = True
+        """bool: Whether the cell list is currently shown, the list is shown when the tab is created"""
+        self._cell_element: Optional[CellElement] = None
+        """CellElement: Element of the cell window, the window is created once and reused"""
+        self._selected_idx: Optional[int] = None
+        """int: Index of the selected cell in the listbox, None if nothing is selected"""
 
         self.frame: Frame = Frame(master)
         self.frame.pack(fill="both", expand=True)
@@ -44,13 +57,12 @@ class GridTabWindow:
                                                        command=self.change_visible)
         self.use_grid_check.grid(column=0, row=0, padx=(5, 0), sticky="nw", pady=(5, 0))
 
-        self.cells_var: Variable = Variable(value=list(map(lambda x: x.get_coords_str(), self._settings_manager.grid)))
-
         self.cells_label: Label = Label(self.frame, text="Cells list")
         self.cells_label.grid(column=0, row=1, sticky="nw", padx=(5, 0))
 
-        self.cells_listbox: Listbox = Listbox(self.frame, listvariable=self.cells_var)
+        self.cells_listbox: Listbox = Listbox(self.frame)
         self.cells_listbox.grid(column=0, row=2, sticky="nwse", columnspan=2, padx=(5, 0))
+        self.update_cells_var()
 
         self.cells_scrollbar: Scrollbar = Scrollbar(self.frame)
         self.cells_scrollbar.grid(column=2, row=2, sticky="ns")
@@ -59,68 +71,80 @@ class GridTabWindow:
         self.cells_listbox["yscrollcommand"] = self.cells_scrollbar.set
         self.cells_scrollbar.config(command=self.cells_listbox.yview)
         self.cells_listbox.bind("<Double-1>", self.edit_cell)
+        self.cells_listbox.bind("<<ListboxSelect>>", self._on_select)
+        # keyboard shortcuts, plain arrows are left for moving the selection
+        self.cells_listbox.bind("<Control-Up>", partial(self._move_cell_by_key, -1))
+        self.cells_listbox.bind("<Control-Down>", partial(self._move_cell_by_key, 1))
+        self.cells_listbox.bind("<Return>", self.edit_cell)
+        self.cells_listbox.bind("<Delete>", self.remove_cell)
 
         self.list_control_button = ListControlButtons(self.frame, 5)
         self.list_control_button.frame_grid(column=3, row=2, sticky="nsew")
 
+        # messages are shown next to the list label instead of a message box, so the window is not blocked
+        self.status_label = StatusLabel(self.frame)
+        self.status_label.label_grid(column=1, row=1, sticky="ne", columnspan=3)
+
         # setup buttons
-        self.list_control_button.configure_button(0, text="↑", command=self.up_cell)
-        self.list_control_button.configure_button(1, text="↓", command=self.down_cell)
+        self.list_control_button.configure_button(0, text="↑", command=partial(self.move_cell, -1))
+        self.list_control_button.configure_button(1, text="↓", command=partial(self.move_cell, 1))
         self.list_control_button.configure_button(2, text="+", command=self.add_cell)
         self.list_control_button.configure_button(3, text="-", command=self.remove_cell)
         self.list_control_button.configure_button(4, text="Edit", command=self.edit_cell)
 
-    def up_cell(self, event: Event = None):
+    def move_cell(self, delta: int, event: Event = None):
         """
-        Handler for button. Move cell up in priority.
+        Handler for buttons. Move cell up or down in priority.
 
         Args:
+            delta (int): Offset by which the cell is moved, -1 to move it up and 1 to move it down.
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        cur_selection = self.cells_listbox.curselection()
-        if len(cur_selection) == 0:
-            messagebox.showerror("Moving error", "Please select which item you want to move", parent=self.master)
+        if self._selected_idx is None:
+            self.status_label.show("Select an item to move")
         else:
-            cell_idx = cur_selection[0]
-            # Check that the cell is no already the first cell and there is a place to lift it to
-            if cell_idx != 0 and len(self._settings_manager.grid) > 1:
-                # swap cell id
-                self._settings_manager.grid[cell_idx].id, self._settings_manager.grid[cell_idx - 1].id = \
-                    self._settings_manager.grid[cell_idx - 1].id, self._settings_manager.grid[cell_idx].id
+            cell_idx = self._selected_idx
+            new_idx = cell_idx + delta
+            # Check that there is a place to move the cell to
+            if 0 <= new_idx < len(self._settings_manager.grid):
+                self._swap(cell_idx, new_idx)
 
-                # swap cell
-                self._settings_manager.grid[cell_idx], self._settings_manager.grid[cell_idx - 1] = \
-                    self._settings_manager.grid[cell_idx - 1], self._settings_manager.grid[cell_idx]
-
-                self.cells_listbox.selection_clear(cell_idx)
-                self.cells_listbox.selection_set(cell_idx - 1)
-                self.update_cells_var()
-
-    def down_cell(self, event: Event = None):
+    def _move_cell_by_key(self, delta: int, event: Event) -> str:
         """
-        Handler for button. Move cell down in priority.
+        Handler for keys. Move cell up or down in priority.
 
         Args:
-            event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
+            delta (int): Offset by which the cell is moved, -1 to move it up and 1 to move it down.
+            event (Event): The instance of Event which contains information about what action happened.
+        Returns:
+            "break" so that the listbox does not also move the selection.
         """
-        cur_selection = self.cells_listbox.curselection()
-        if len(cur_selection) == 0:
-            messagebox.showerror("Moving error", "Please select which item you want to move", parent=self.master)
-        else:
-            cell_idx = cur_selection[0]
-            # Check that the cell is no already the last cell and there is a place to lower it to
-            if cell_idx != self.cells_listbox.size() - 1 and len(self._settings_manager.grid) > 1:
-                # swap cell id
-                self._settings_manager.grid[cell_idx].id, self._settings_manager.grid[cell_idx + 1].id = \
-                    self._settings_manager.grid[cell_idx + 1].id, self._settings_manager.grid[cell_idx].id
+        self.move_cell(delta, event)
+        return "break"
 
-                # swap cell
-                self._settings_manager.grid[cell_idx], self._settings_manager.grid[cell_idx + 1] = \
-                    self._settings_manager.grid[cell_idx + 1], self._settings_manager.grid[cell_idx]
+    def _swap(self, i: int, j: int):
+        """
+        Swapping two cells and their ids, only the two affected rows of the listbox are updated.
 
-                self.cells_listbox.selection_clear(cell_idx)
-                self.cells_listbox.selection_set(cell_idx + 1)
-                self.update_cells_var()
+        Args:
+            i (int): Index of the selected cell.
+            j (int): Index of the cell to swap with, it will be selected after swapping.
+        """
+        grid = self._settings_manager.grid
+        cell_i = grid[i]
+        cell_j = grid[j]
+        cell_i.id, cell_j.id = cell_j.id, cell_i.id
+        grid[i], grid[j] = cell_j, cell_i
+
+        cells_listbox = self.cells_listbox
+        cells_listbox.delete(i)
+        cells_listbox.insert(i, cell_j.get_coords_str())
+        cells_listbox.delete(j)
+        cells_listbox.insert(j, cell_i.get_coords_str())
+        cells_listbox.selection_clear(0, "end")
+        cells_listbox.selection_set(j)
+        self._selected_idx = j
+        cells_listbox.see(j)
 
     def add_cell(self, event: Event = None):
         """
@@ -129,8 +153,7 @@ class GridTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        cell_window = self.get_cell_window()
-        cell_element = CellElement(cell_window, self._settings_manager.grid, -1)
+        self.get_cell_element(-1)
 
     def remove_cell(self, event: Event = None):
         """
@@ -139,13 +162,12 @@ class GridTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        cur_selection = self.cells_listbox.curselection()
-        if len(cur_selection) == 0:
-            messagebox.showerror("Deleting error", "Please select which item you want to delete", parent=self.master)
+        if self._selected_idx is None:
+            self.status_label.show("Select an item to delete")
         else:
-            self.cells_listbox.delete(cur_selection)
-            self._settings_manager.grid.pop(cur_selection[0])
-            self.update_cells_var()
+            self.cells_listbox.delete(self._selected_idx)
+            self._settings_manager.grid.pop(self._selected_idx)
+            self._selected_idx = None
 
     def edit_cell(self, event: Event = None):
         """
@@ -154,40 +176,80 @@ class GridTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        cur_selection = self.cells_listbox.curselection()
-        if len(cur_selection) == 0:
-            messagebox.showerror("Editing error", "Please select which item you want to edit", parent=self.master)
+        if self._selected_idx is None:
+            self.status_label.show("Select an item to edit")
         else:
-            cell_idx = cur_selection[0]
-            cell_window = self.get_cell_window()
-            cell = self._settings_manager.grid[cell_idx]
-            cell_element = CellElement(cell_window, self._settings_manager.grid, cell_idx)
+            self.get_cell_element(self._selected_idx)
 
-    def get_cell_window(self, event: Event = None) -> Toplevel:
+    def get_cell_element(self, cell_idx: int) -> CellElement:
         """
-        Creating a new window where the cell attributes will be placed.
+        Showing the window with the cell attributes, the window is created on the first call.
 
         Args:
-            event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
+            cell_idx (int): Index of the cell to be viewed, -1 for a new cell.
 
         Returns:
-            Window in which to place the elements.
+            Element of the cell window.
         """
-        cell_window = Toplevel(self.frame)
-        cell_window.geometry("220x100")
-        cell_window.resizable(0, 0)
-        cell_window.title("View cell")
-        cell_window.bind("<Destroy>", self.update_cells_var)
-        return cell_window
+        if self._cell_element is None:
+            cell_window = Toplevel(self.frame)
+            cell_window.geometry("220x100")
+            cell_window.resizable(0, 0)
+            cell_window.title("View cell")
+            self._cell_element = CellElement(cell_window, self._settings_manager.grid, cell_idx, self.update_cell_row)
+        else:
+            self._cell_element.reset(self._settings_manager.grid, cell_idx)
+            self._cell_element.master.deiconify()
+            self._cell_element.master.lift()
+        return self._cell_element
 
     def update_cells_var(self, event: Event = None):
         """
-        Updating the field responsible for representing the list of cell coordinates.
+        Updating the listbox representing the list of cell coordinates.
+
+        Args:
+            event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
+        """
+        cells_listbox = self.cells_listbox
+        # all rows are inserted with a single Tcl call
+        cells_listbox.delete(0, "end")
+        self._selected_idx = None
+        cells_listbox.insert("end", *map(_get_coords_str, self._settings_manager.grid))
+
+    def update_cell_row(self, cell_element: CellElement):
+        """
+        Updating the listbox after the cell window is closed.
+
+        Args:
+            cell_element (CellElement): Element in which the cell was edited.
+        """
+        if not cell_element.is_saved:
+            return
+        cell = cell_element.cell
+        # the window is not modal, so the list may have changed while it was open and the row is looked up by the cell
+        cell_idx = next((idx for idx, grid_cell in enumerate(self._settings_manager.grid) if grid_cell is cell), None)
+        if cell_idx is None:
+            return
+        cells_listbox = self.cells_listbox
+        # a new cell is added to the end of the list
+        if cell_idx == cells_listbox.size():
+            cells_listbox.insert("end", cell.get_coords_str())
+            return
+        cells_listbox.delete(cell_idx)
+        cells_listbox.insert(cell_idx, cell.get_coords_str())
+        cells_listbox.selection_clear(0, "end")
+        cells_listbox.selection_set(cell_idx)
+        self._selected_idx = cell_idx
+
+    def _on_select(self, event: Event = None):
+        """
+        Remembering the selected cell, so that the handlers do not have to query the listbox.
 
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        self.cells_var.set(list(map(lambda x: x.get_coords_str(), self._settings_manager.grid)))
+        cur_selection = self.cells_listbox.curselection()
+        self._selected_idx = cur_selection[0] if cur_selection else None
 
     def update_use_grid_var(self, event: Event = None):
         """
@@ -206,16 +268,30 @@ class GridTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        if self.is_use_grid.get():
+        is_use_grid = bool(self.is_use_grid.get())
+        self._settings_manager.settings.using_grid = is_use_grid
+        # several calls in a row are merged into one layout pass
+        if self._visible_after_id is not None:
+            self.frame.after_cancel(self._visible_after_id)
+        elif is_use_grid == self._is_list_visible:
+            return
+        self._visible_after_id = self.frame.after(50, self._change_visible_now)
+
+    def _change_visible_now(self):
+        """Showing or hiding the cell list according to the current grid usage checkbox value."""
+        self._visible_after_id = None
+        is_use_grid = bool(self.is_use_grid.get())
+        if is_use_grid == self._is_list_visible:
+            return
+        self._is_list_visible = is_use_grid
+        if is_use_grid:
             self.cells_label.grid()
             self.cells_listbox.grid()
             self.cells_scrollbar.grid()
             self.list_control_button.frame_grid()
-            self._settings_manager.settings.using_grid = True
 
         else:
             self.cells_label.grid_remove()
             self.cells_listbox.grid_remove()
             self.cells_scrollbar.grid_remove()
             self.list_control_button.button_frame.grid_remove()
-            self._settings_manager.settings.using_grid = False
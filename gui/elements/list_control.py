@@ -1,5 +1,5 @@
 from tkinter import Frame, Button
-from typing import List
+from typing import Tuple
 
 
 class ListControlButtons:
@@ -24,15 +24,17 @@ class ListControlButtons:
             raise ValueError("Number of buttons must be a positive number.")
         self.button_frame: Frame = Frame(master)
         self._count = count
-        self._button_list: List[Button] = []
-        """list: List of all created buttons"""
+        self._button_list: Tuple[Button, ...] = tuple(Button(self.button_frame) for _ in range(count))
+        """tuple: All created buttons"""
 
-        # setup buttons
-        for i in range(count):
-            self._button_list.append(Button(self.button_frame))
-            self._button_list[i].grid(column=0, row=i, sticky="nwe", pady=(5, 0))
+        # setup buttons, the first one has no top padding
+        for i, button in enumerate(self._button_list):
+            button.grid(column=0, row=i, sticky="nwe", pady=(5, 0) if i else 0)
 
-        self._button_list[0].grid(column=0, row=0, sticky="nwe", pady=0)
+        self._disable_script: str = self.get_state_script("disabled")
+        """str: Tcl script that disables all buttons with one call"""
+        self._enable_script: str = self.get_state_script("normal")
+        """str: Tcl script that enables all buttons with one call"""
 
     def frame_grid(self, **kwargs):
         """
@@ -53,12 +55,21 @@ class ListControlButtons:
         """
         self._button_list[idx].configure(**kwargs)
 
+    def get_state_script(self, state: str) -> str:
+        """
+        Builds a Tcl script that sets the state of all buttons, so it can be run together with other commands.
+
+        Args:
+            state (str): State of the buttons, "normal" or "disabled".
+        Returns:
+            Tcl script.
+        """
+        return "\n".join(f"{button} configure -state {state}" for button in self._button_list)
+
     def disable(self):
         """Disables user interaction with all buttons."""
-        for button in self._button_list:
-            button.configure(state="disabled")
+        self.button_frame.tk.eval(self._disable_script)
 
     def enable(self):
         """Enables user interaction with all buttons."""
-        for button in self._button_list:
-            button.configure(state="normal")
+        self.button_frame.tk.eval(self._enable_script)
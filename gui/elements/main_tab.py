@@ -1,12 +1,20 @@
-from tkinter import Frame, Variable, Label, Listbox, Scrollbar, Event, messagebox, Toplevel
-from typing import Callable, List
+from collections import deque
+from multiprocessing.process import BaseProcess
+from operator import attrgetter, methodcaller
+from threading import Thread
+from tkinter import Frame, Label, Listbox, Scrollbar, Event, Toplevel
+from typing import Callable, Optional, Union, Tuple
 
 from daemon import processing_start
 from gui.elements.editing_control import HorizontalButtons
 from gui.elements.list_control import ListControlButtons
+from gui.elements.status_label import StatusLabel
 from gui.elements.window_attributes import WindowAttributesElement
 from settings import SettingsManager
 
+_get_process_name = attrgetter("process_name")
+_call = methodcaller("__call__")
+
 
 class MainTabWindow:
     """
@@ -16,12 +24,12 @@ class MainTabWindow:
         master: Parent window.
         frame: Frame that will contain all elements.
         is_processing: Field indicating whether window processing is running or not.
-        windows_attributes_var: Field representing a list of the process name for each window attributes.
         start_stop_buttons: Buttons that can be used to start or stop window processing.
         windows_attributes_label: Label in front of listbox displaying windows attributes.
         windows_attributes_listbox: Listbox that displays windows attributes.
         windows_attributes_scrollbar: Scrollbar to scroll through the list of windows attributes.
         list_control_button (ListControlButtons): Buttons that let manage the windows attributes in the list.
+        status_label (StatusLabel): Label that shows messages about user actions.
     """
 
     def __init__(self, master, settings_manager: SettingsManager):
@@ -35,10 +43,22 @@ class MainTabWindow:
         self.master = master
         self._settings_manager = settings_manager
         self.is_processing: bool = False
-        self._start_handle_list: List[Callable] = []
-        """List[Callable]: List containing callable objects that will be called before window processing"""
-        self._stop_handle_list: List[Callable] = []
-        """List[Callable]: List containing callable objects that will be called after window processing"""
+        self._start_handles: Tuple[Callable, ...] = ()
+        """Tuple[Callable, ...]: Callable objects that will be called before window processing"""
+        self._stop_handles: Tuple[Callable, ...] = ()
+        """Tuple[Callable, ...]: Callable objects that will be called after window processing"""
+        self._worker: Optional[Union[Thread, BaseProcess]] = None
+        """Union[Thread, BaseProcess]: Worker in which windows are processed"""
+        self._is_stopping: bool = False
+        """bool: Whether processing was stopped, but the worker has not finished yet"""
+        self._wait_after_id: Optional[str] = None
+        """str: Identifier of the scheduled check whether the worker has finished"""
+        self._is_start_blocked: bool = False
+        """bool: Whether processing can't be started, for example while a settings file is being read"""
+        self._window_attributes_element: Optional[WindowAttributesElement] = None
+        """WindowAttributesElement: Element of the window attributes window, the window is created once and reused"""
+        self._selected_idx: Optional[int] = None
+        """int: Index of the selected window attributes in the listbox, None if nothing is selected"""
 
         self.frame: Frame = Frame(master)
         self.frame.pack(fill="both", expand=True)
@@ -46,9 +66,6 @@ class MainTabWindow:
         self.frame.columnconfigure(0, weight=2)
         self.frame.columnconfigure(1, weight=1)
 
-        self.windows_attributes_var: Variable = Variable(
-            value=list(map(lambda x: x.process_name, self._settings_manager.windows_attributes)))
-
         self.start_stop_buttons = HorizontalButtons(self.frame, 2)
         self.start_stop_buttons.frame_grid(column=0, row=0, sticky="nw", pady=10, padx=(5, 0))
         self.start_stop_buttons.configure_button(0, text="Start processing", command=self.start_processing)
@@ -57,8 +74,9 @@ class MainTabWindow:
         self.windows_attributes_label: Label = Label(self.frame, text="Process list")
         self.windows_attributes_label.grid(column=0, row=1, sticky="nw", padx=(5, 0))
 
-        self.windows_attributes_listbox: Listbox = Listbox(self.frame, listvariable=self.windows_attributes_var)
+        self.windows_attributes_listbox: Listbox = Listbox(self.frame)
         self.windows_attributes_listbox.grid(column=0, row=2, sticky="nwse", columnspan=2, padx=(5, 0))
+        self.update_windows_attributes_var()
 
         self.windows_attributes_scrollbar: Scrollbar = Scrollbar(self.frame)
         self.windows_attributes_scrollbar.grid(column=2, row=2, sticky="ns")
@@ -67,15 +85,28 @@ class MainTabWindow:
         self.windows_attributes_listbox["yscrollcommand"] = self.windows_attributes_scrollbar.set
         self.windows_attributes_scrollbar.config(command=self.windows_attributes_listbox.yview)
         self.windows_attributes_listbox.bind("<Double-1>", self.edit_window_attributes)
+        self.windows_attributes_listbox.bind("<<ListboxSelect>>", self._on_select)
 
         self.list_control_button = ListControlButtons(self.frame, 3)
         self.list_control_button.frame_grid(column=3, row=2, sticky="nsew")
 
+        # messages are shown next to the list label instead of a message box, so the window is not blocked
+        self.status_label = StatusLabel(self.frame)
+        self.status_label.label_grid(column=1, row=1, sticky="ne", columnspan=3)
+
         # setup buttons
         self.list_control_button.configure_button(0, text="+", command=self.add_window_attributes)
         self.list_control_button.configure_button(1, text="-", command=self.remove_window_attributes)
         self.list_control_button.configure_button(2, text="Edit", command=self.edit_window_attributes)
 
+        # the state of all controls is changed with one Tcl call
+        self._disable_controls_script: str = "\n".join((self.list_control_button.get_state_script("disabled"),
+                                                          self.start_stop_buttons.get_state_script(0, "disabled"),
+                                                          self.start_stop_buttons.get_state_script(1, "normal")))
+        self._enable_controls_script: str = "\n".join((self.list_control_button.get_state_script("normal"),
+                                                         self.start_stop_buttons.get_state_script(0, "normal"),
+                                                         self.start_stop_buttons.get_state_script(1, "disabled")))
+
         self.enable_controls()
 
     def start_processing(self, event: Event = None):
@@ -85,11 +116,18 @@ class MainTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
+        # the tray menu can start processing again while the Tk loop is blocked and the previous worker is stopping
+        if self.is_processing or not self._finish_stopping(0.5):
+            return
+        if self._is_start_blocked:
+            self.status_label.show("Settings are being loaded")
+            return
         self.is_processing = True
         self.disable_controls()
         self._process_start_handles()
         self._settings_manager.is_running = True
-        processing_start(self._settings_manager)
+        # the worker is started in the background, so the call returns immediately
+        self._worker = processing_start(self._settings_manager)
 
     def stop_processing(self, event: Event = None):
         """
@@ -98,8 +136,59 @@ class MainTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
+        if not self.is_processing:
+            return
         self._settings_manager.is_running = False
         self.is_processing = False
+        self._is_stopping = True
+        self.start_stop_buttons.configure_button(1, state="disabled")
+        self._wait_worker()
+
+    def _wait_worker(self):
+        """Enabling the controls once the worker has finished, so that a new start cannot overlap the old worker."""
+        if self._worker.is_alive():
+            self._wait_after_id = self.frame.after(20, self._wait_worker)
+            return
+        self._wait_after_id = None
+        self._stopped()
+
+    def block_start(self):
+        """Disables the start of processing, for example while new settings are being loaded."""
+        self._is_start_blocked = True
+        self.start_stop_buttons.configure_button(0, state="disabled")
+
+    def unblock_start(self):
+        """Enables the start of processing again."""
+        self._is_start_blocked = False
+        if not self.is_processing and not self._is_stopping:
+            self.start_stop_buttons.configure_button(0, state="normal")
+
+    def _finish_stopping(self, timeout: float) -> bool:
+        """
+        Waiting for the worker of the stopped processing without the Tk loop, which may be blocked by the tray icon.
+
+        Args:
+            timeout (float): Maximum waiting time in seconds.
+
+        Returns:
+            True if there is no worker left running, otherwise False.
+        """
+        if not self._is_stopping:
+            return True
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            self.status_label.show("Processing is still stopping")
+            return False
+        if self._wait_after_id is not None:
+            self.frame.after_cancel(self._wait_after_id)
+            self._wait_after_id = None
+        self._stopped()
+        return True
+
+    def _stopped(self):
+        """Enabling the controls after the worker has finished."""
+        self._is_stopping = False
+        self._worker = None
         self.enable_controls()
         self._process_stop_handles()
 
@@ -110,9 +199,7 @@ class MainTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        window_attributes_edit = self.get_window_attributes_element()
-        exclude_window_element = WindowAttributesElement(window_attributes_edit,
-                                                         self._settings_manager.windows_attributes, -1)
+        self.get_window_attributes_element(-1)
 
     def remove_window_attributes(self, event: Event = None):
         """
@@ -121,13 +208,12 @@ class MainTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        cur_selection = self.windows_attributes_listbox.curselection()
-        if len(cur_selection) == 0:
-            messagebox.showerror("Deleting error", "Please select which item you want to delete", parent=self.master)
+        if self._selected_idx is None:
+            self.status_label.show("Select an item to delete")
         else:
-            self.windows_attributes_listbox.delete(cur_selection)
-            self._settings_manager.windows_attributes.pop(cur_selection[0])
-            self.update_windows_attributes_var()
+            self.windows_attributes_listbox.delete(self._selected_idx)
+            self._settings_manager.windows_attributes.pop(self._selected_idx)
+            self._selected_idx = None
 
     def edit_window_attributes(self, event: Event = None):
         """
@@ -136,55 +222,94 @@ class MainTabWindow:
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        cur_selection = self.windows_attributes_listbox.curselection()
-        if len(cur_selection) == 0:
-            messagebox.showerror("Editing error", "Please select which item you want to edit", parent=self.master)
+        if self._selected_idx is None:
+            self.status_label.show("Select an item to edit")
         # editing is possible if window processing is not started
         elif not self.is_processing:
-            window_attributes_idx = cur_selection[0]
-            window_attributes_edit = self.get_window_attributes_element()
-            window_attributes = self._settings_manager.windows_attributes[window_attributes_idx]
-            window_attributes_element = WindowAttributesElement(window_attributes_edit,
-                                                                self._settings_manager.windows_attributes,
-                                                                window_attributes_idx)
+            self.get_window_attributes_element(self._selected_idx)
 
-    def get_window_attributes_element(self, event: Event = None) -> Toplevel:
+    def get_window_attributes_element(self, window_attributes_idx: int) -> WindowAttributesElement:
         """
-        Creating a new window where the window attributes will be placed.
+        Showing the window with the window attributes, the window is created on the first call.
 
         Args:
-            event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
+            window_attributes_idx (int): Index of the window attributes to be viewed, -1 for a new window attributes.
 
         Returns:
-            Window in which to place the elements.
+            Element of the window attributes window.
         """
-        window_attributes_element = Toplevel(self.frame)
-        window_attributes_element.geometry("330x460")
-        window_attributes_element.resizable(0, 0)
-        window_attributes_element.title("View window attributes")
-        window_attributes_element.bind("<Destroy>", self.update_windows_attributes_var)
-        return window_attributes_element
+        if self._window_attributes_element is None:
+            window_attributes_edit = Toplevel(self.frame)
+            window_attributes_edit.geometry("330x460")
+            window_attributes_edit.resizable(0, 0)
+            window_attributes_edit.title("View window attributes")
+            self._window_attributes_element = WindowAttributesElement(window_attributes_edit,
+                                                                      self._settings_manager.windows_attributes,
+                                                                      window_attributes_idx,
+                                                                      self.update_window_attributes_row)
+        else:
+            self._window_attributes_element.reset(self._settings_manager.windows_attributes, window_attributes_idx)
+            self._window_attributes_element.master.deiconify()
+            self._window_attributes_element.master.lift()
+        return self._window_attributes_element
 
     def update_windows_attributes_var(self, event: Event = None):
         """
-        Updating the field responsible for representing the list of process name for each window attributes.
+        Updating the listbox representing the list of process name for each window attributes.
 
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        self.windows_attributes_var.set(list(map(lambda x: x.process_name, self._settings_manager.windows_attributes)))
+        windows_attributes_listbox = self.windows_attributes_listbox
+        # all rows are inserted with a single Tcl call
+        windows_attributes_listbox.delete(0, "end")
+        self._selected_idx = None
+        windows_attributes_listbox.insert("end", *map(_get_process_name, self._settings_manager.windows_attributes))
+
+    def update_window_attributes_row(self, window_attributes_element: WindowAttributesElement):
+        """
+        Updating the listbox after the window attributes window is closed.
+
+        Args:
+            window_attributes_element (WindowAttributesElement): Element in which the window attributes were edited.
+        """
+        if not window_attributes_element.is_saved:
+            return
+        window_attributes = window_attributes_element.window_attributes
+        # the window is not modal, so the list may have changed while it was open and the row is looked up by the item
+        window_attributes_idx = next((idx for idx, item in enumerate(self._settings_manager.windows_attributes)
+                                      if item is window_attributes), None)
+        if window_attributes_idx is None:
+            return
+        process_name = window_attributes.process_name
+        windows_attributes_listbox = self.windows_attributes_listbox
+        # a new window attributes is added to the end of the list
+        if window_attributes_idx == windows_attributes_listbox.size():
+            windows_attributes_listbox.insert("end", process_name)
+            return
+        windows_attributes_listbox.delete(window_attributes_idx)
+        windows_attributes_listbox.insert(window_attributes_idx, process_name)
+        windows_attributes_listbox.selection_clear(0, "end")
+        windows_attributes_listbox.selection_set(window_attributes_idx)
+        self._selected_idx = window_attributes_idx
+
+    def _on_select(self, event: Event = None):
+        """
+        Remembering the selected window attributes, so that the handlers do not have to query the listbox.
+
+        Args:
+            event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
+        """
+        cur_selection = self.windows_attributes_listbox.curselection()
+        self._selected_idx = cur_selection[0] if cur_selection else None
 
     def disable_controls(self):
         """Disables user interaction with specified buttons."""
-        self.list_control_button.disable()
-        self.start_stop_buttons.configure_button(0, state="disabled")
-        self.start_stop_buttons.configure_button(1, state="normal")
+        self.frame.tk.eval(self._disable_controls_script)
 
     def enable_controls(self):
         """Enables user interaction with specified buttons."""
-        self.list_control_button.enable()
-        self.start_stop_buttons.configure_button(0, state="normal")
-        self.start_stop_buttons.configure_button(1, state="disabled")
+        self.frame.tk.eval(self._enable_controls_script)
 
     def add_start_handle(self, handle: Callable):
         """
@@ -193,7 +318,7 @@ class MainTabWindow:
         Args:
             handle (Callable): Instance that will be added to the list
         """
-        self._start_handle_list.append(handle)
+        self._start_handles += (handle,)
 
     def add_stop_handle(self, handle: Callable):
         """
@@ -202,14 +327,12 @@ class MainTabWindow:
         Args:
             handle (Callable): Instance that will be added to the list
         """
-        self._stop_handle_list.append(handle)
+        self._stop_handles += (handle,)
 
     def _process_start_handles(self):
         """Calling all callable objects that are in the list to be called before starting window processing"""
-        for handle in self._start_handle_list:
-            handle()
+        deque(map(_call, self._start_handles), maxlen=0)
 
     def _process_stop_handles(self):
         """Calling all callable objects that are in the list to be called after starting window processing"""
-        for handle in self._stop_handle_list:
-            handle()
+        deque(map(_call, self._stop_handles), maxlen=0)
@@ -1,7 +1,16 @@
+from collections import deque
+from copy import deepcopy
+from operator import methodcaller
+from queue import Queue, Empty
+from threading import Thread
 from tkinter import Menu, filedialog, messagebox
-from typing import Callable, List
+from typing import Callable, Any, Optional, Tuple
 
-from settings import SettingsManager, Settings, get_settings, save_settings
+from settings import SettingsManager, Settings, get_settings, save_settings, renumber_grid
+
+_call = methodcaller("__call__")
+_OPEN_FILE_TYPES = (("Setting files (*.yaml)", "*.yaml"), ("all files", "*"))
+_SAVE_FILE_TYPES = (("Setting files (.yaml)", ".yaml"), ("all files", ".*"))
 
 
 class SettingsControlMenu:
@@ -17,8 +26,14 @@ class SettingsControlMenu:
         """
         self.master = master
         self.settings_manager = init_settings
-        self._handle_list: List[Callable] = []
-        """List[Callable]: List containing callable objects that will be called after a settings update."""
+        self._handles: Tuple[Callable, ...] = ()
+        """Tuple[Callable, ...]: Callable objects that will be called after a settings update."""
+        self._load_start_handles: Tuple[Callable, ...] = ()
+        """Tuple[Callable, ...]: Callable objects that will be called before a settings file is read."""
+        self._load_finish_handles: Tuple[Callable, ...] = ()
+        """Tuple[Callable, ...]: Callable objects that will be called after the read settings are applied."""
+        self._disable_count: int = 0
+        """int: Number of reasons for which the menu items are disabled, such as processing or a file operation."""
         self.file_menu = Menu(master, tearoff=0)
         self.file_menu.add_command(label="New", command=self.new_settings)
         self.file_menu.add_command(label="Open", command=self.open_settings)
@@ -33,29 +48,92 @@ class SettingsControlMenu:
 
     def open_settings(self):
         """Menu option handler. Opens a dialog box for selecting a settings file to load."""
-        file_types = (("Setting files (*.yaml)", "*.yaml"), ("all files", "*"))
         file_selected = filedialog.askopenfilename(
-            title="Select file for open", initialdir=".", filetypes=file_types
+            title="Select file for open", initialdir=".", filetypes=_OPEN_FILE_TYPES
         )
         if file_selected != "":
-            settings = get_settings(file_selected)
-            if settings is None:
-                messagebox.showerror("Settings error",
-                                     "Error reading the selected settings file. Please try again with a different file",
-                                     parent=self.master)
-            else:
-                self.settings_manager.reconfigure(settings)
-                self._reload_settings()
+            # the settings must not be replaced under a running worker, so processing is not started until then
+            deque(map(_call, self._load_start_handles), maxlen=0)
+            self._run_in_background(get_settings, (file_selected,), self._apply_loaded_settings)
+
+    def _apply_loaded_settings(self, settings: Optional[Settings]):
+        """
+        Applying the settings read from a file.
+
+        Args:
+            settings (:obj:`Settings`, optional): The read settings, None if the file could not be read.
+        """
+        if settings is None:
+            messagebox.showerror("Settings error",
+                                 "Error reading the selected settings file. Please try again with a different file",
+                                 parent=self.master)
+        else:
+            self.settings_manager.reconfigure(settings)
+            self._reload_settings()
+        deque(map(_call, self._load_finish_handles), maxlen=0)
 
     def save_settings(self):
         """Menu option handler. Opens a file selection dialog box for saving the current settings."""
-        file_types = (("Setting files (.yaml)", ".yaml"), ("all files", ".*"))
         file_selected = filedialog.asksaveasfilename(
-            title="Select file for save", initialdir=".", filetypes=file_types, defaultextension=".yaml",
+            title="Select file for save", initialdir=".", filetypes=_SAVE_FILE_TYPES, defaultextension=".yaml",
             initialfile="settings.yaml"
         )
         if file_selected != "":
-            save_settings(self.settings_manager.settings, file_selected)
+            settings = self.settings_manager.settings
+            renumber_grid(settings)
+            # the lists can be edited while the file is written, so the thread gets its own copy
+            self._run_in_background(save_settings, (deepcopy(settings), file_selected))
+
+    def _run_in_background(self, target: Callable, args: tuple, on_done: Callable[[Any], None] = None):
+        """
+        Running a file operation in a separate thread so that it does not block the window.
+
+        Args:
+            target (Callable): Function to be called in the thread.
+            args (tuple): Arguments for the function.
+            on_done (:obj:`Callable`, optional): Called in the Tk thread with the function result. Defaults to None.
+        """
+        # only one file operation at a time, and the settings are not replaced while it runs
+        self.disable()
+        self.file_menu.entryconfig("Save", state="disabled")
+        result_queue: Queue = Queue(maxsize=1)
+        Thread(target=self._call_in_thread, args=(target, args, result_queue), daemon=True).start()
+        # Tk must only be used from its own thread, so the result is polled here instead of being posted by the worker
+        self.master.after(20, self._wait_result, result_queue, on_done)
+
+    @staticmethod
+    def _call_in_thread(target: Callable, args: tuple, result_queue: Queue):
+        """
+        Calling the function and placing its result in the queue, None is placed if the function failed.
+
+        Args:
+            target (Callable): Function to be called.
+            args (tuple): Arguments for the function.
+            result_queue (Queue): Queue in which the result will be placed.
+        """
+        result = None
+        try:
+            result = target(*args)
+        finally:
+            result_queue.put(result)
+
+    def _wait_result(self, result_queue: Queue, on_done: Callable[[Any], None] = None):
+        """
+        Checking whether a file operation has finished and passing its result on.
+
+        Args:
+            result_queue (Queue): Queue in which the result of the operation will be placed.
+            on_done (:obj:`Callable`, optional): Called with the result of the operation. Defaults to None.
+        """
+        try:
+            result = result_queue.get_nowait()
+        except Empty:
+            self.master.after(20, self._wait_result, result_queue, on_done)
+            return
+        self.file_menu.entryconfig("Save", state="normal")
+        self.enable()
+        if on_done is not None:
+            on_done(result)
 
     def exit(self):
         """Menu option handler. Closing the root window."""
@@ -68,21 +146,37 @@ class SettingsControlMenu:
         Args:
             handle (Callable): Instance that will be added to the list
         """
-        self._handle_list.append(handle)
+        self._handles += (handle,)
+
+    def add_load_handles(self, start_handle: Callable, finish_handle: Callable):
+        """
+        Add the objects to be called before a settings file is read and after the read settings are applied.
+
+        Args:
+            start_handle (Callable): Instance that will be called before the file is read.
+            finish_handle (Callable): Instance that will be called after the settings are applied.
+        """
+        self._load_start_handles += (start_handle,)
+        self._load_finish_handles += (finish_handle,)
 
     def _reload_settings(self):
         """Calling all callable objects that are in the list to be called after a settings update"""
-        for handle in self._handle_list:
-            handle()
+        deque(map(_call, self._handles), maxlen=0)
 
     def disable(self):
         """Disables user interaction with specified menu items."""
+        self._disable_count += 1
+        if self._disable_count > 1:
+            return
         self.file_menu.entryconfig("New", state="disabled")
         self.file_menu.entryconfig("Open", state="disabled")
         self.file_menu.entryconfig("Exit", state="disabled")
 
     def enable(self):
-        """Enables user interaction with specified menu items."""
+        """Enables user interaction with specified menu items, once every reason to disable them is gone."""
+        self._disable_count = max(self._disable_count - 1, 0)
+        if self._disable_count > 0:
+            return
         self.file_menu.entryconfig("New", state="normal")
         self.file_menu.entryconfig("Open", state="normal")
         self.file_menu.entryconfig("Exit", state="normal")
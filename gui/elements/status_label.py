@@ -0,0 +1,51 @@
+from tkinter import Label
+from typing import Optional
+
+
+class StatusLabel:
+    """
+    Class that provides a label for showing short messages inside the window instead of a message box.
+
+    Attributes:
+        label: Label that displays the message.
+    """
+
+    def __init__(self, master, timeout: int = 2500):
+        """
+        Construct a label for messages.
+
+        Args:
+            master: Parent window.
+            timeout (int): Time in milliseconds after which the message is hidden.
+        """
+        self.label: Label = Label(master, text="", fg="red")
+        self._timeout = timeout
+        self._clear_after_id: Optional[str] = None
+        """str: Identifier of the scheduled clearing of the message"""
+
+    def label_grid(self, **kwargs):
+        """
+        Lets to pass parameters to the function that controls the grid setting for the label.
+
+        Args:
+            **kwargs: Arbitrary keyword arguments.
+        """
+        self.label.grid(**kwargs)
+
+    def show(self, text: str):
+        """
+        Showing the message, it will be hidden after the timeout.
+
+        Args:
+            text (str): Message to be shown.
+        """
+        # the timeout is restarted for each new message
+        if self._clear_after_id is not None:
+            self.label.after_cancel(self._clear_after_id)
+        self.label.configure(text=text)
+        self._clear_after_id = self.label.after(self._timeout, self.clear)
+
+    def clear(self):
+        """Hiding the message."""
+        self._clear_after_id = None
+        self.label.configure(text="")
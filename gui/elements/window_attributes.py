@@ -1,12 +1,16 @@
-from tkinter import Label, Entry, IntVar, Checkbutton, Variable, Listbox, Scrollbar, messagebox, Event, Toplevel
-from typing import List
+from functools import partial
+from operator import attrgetter
+from tkinter import Label, Entry, IntVar, Checkbutton, Listbox, Scrollbar, messagebox, Event, Toplevel
+from typing import List, Callable, Optional, Tuple
 
 from gui.elements.editing_control import HorizontalButtons
 from gui.elements.exclude_window import ExcludeWindowElement
 from gui.elements.list_control import ListControlButtons
-from gui.validators import is_positive_number, get_number
+from gui.validators import get_number_validator, get_number
 from settings import WindowAttributes
 
+_get_name = attrgetter("name")
+
 
 class WindowAttributesElement:
     """
@@ -17,6 +21,7 @@ class WindowAttributesElement:
         windows_attributes_list (List[Cell]): List of all window attributes.
         windows_attributes_idx (int): Index of the window attributes to be viewed.
         window_attributes (WindowAttributes): Current open window attributes.
+        is_saved (bool): Indicates whether the window attributes were saved before the window was closed.
         process_name_label: Label in front of the field for entering process name.
         process_name_entry: Field for entering process name.
         width_label: Label in front of the field for entering window width.
@@ -30,14 +35,14 @@ class WindowAttributesElement:
         is_use_coords: Field indicating whether to place the window at the specified coordinates.
         use_coords_label: Label in front of the checkbox that represents the state of the is_use_coords field.
         use_coords_check: Checkbox that represents the state of the is_use_coords field.
-        exclude_windows_var: Field representing the list of exclude windows name for this window attributes.
         exclude_windows_label: Label in front of listbox displaying exclude windows name for this window attributes.
         exclude_windows_listbox: Listbox that displays exclude windows name for this window attributes.
         exclude_windows_listbox_scrollbar: Scrollbar to scroll through the list of exclude windows name for this window attributes.
         list_control_button (ListControlButtons): Buttons that let manage the exclude windows in the list for this window attributes.
         editing_control_buttons (HorizontalButtons): Buttons to control the editing process.
     """
-    def __init__(self, master, windows_attributes_list: List[WindowAttributes], windows_attributes_idx: int):
+    def __init__(self, master, windows_attributes_list: List[WindowAttributes], windows_attributes_idx: int,
+                 on_exit: Optional[Callable[["WindowAttributesElement"], None]] = None):
         """
         Construct a window for viewing cell attributes.
 
@@ -45,69 +50,35 @@ class WindowAttributesElement:
             master: Parent window.
             windows_attributes_list (List[WindowAttributes]): List of all window attributes.
             windows_attributes_idx (int): Index of the window attributes to be viewed.
+            on_exit (:obj:`Callable`, optional): Called with this element after the window is hidden. Defaults to None.
         """
         self.master = master
-        self.windows_attributes_list = windows_attributes_list
-        self.windows_attributes_idx = windows_attributes_idx
+        self._on_exit = on_exit
 
-        self._number_validator = self.master.register(is_positive_number)
+        self._number_validator = get_number_validator(self.master)
 
-        self.window_attributes = WindowAttributes()
-        if self.windows_attributes_idx >= 0:
-            self.window_attributes = self.windows_attributes_list[self.windows_attributes_idx]
         self.process_name_label: Label = Label(master, text="Process name")
         self.process_name_label.grid(column=0, row=0, sticky="nw", padx=(5, 0))
 
         self.process_name_entry: Entry = Entry(master)
-        self.process_name_entry.insert(0, self.window_attributes.process_name)
         self.process_name_entry.grid(column=0, row=1, padx=(5, 0))
 
-        self.width_label: Label = Label(master, text="Width")
-        self.width_label.grid(column=0, row=2, sticky="nw", pady=(15, 0), padx=(5, 0))
-
-        self.width_entry: Entry = Entry(master, validate="key", validatecommand=(self._number_validator, "%P"))
-        self.width_entry.insert(0, str(self.window_attributes.width))
-        self.width_entry.grid(column=0, row=3, padx=(5, 0))
-
-        self.height_label: Label = Label(master, text="Height")
-        self.height_label.grid(column=1, row=2, sticky="nw", pady=(15, 0), padx=(15, 0))
-
-        self.height_entry: Entry = Entry(master, validate="key", validatecommand=(self._number_validator, "%P"))
-        self.height_entry.insert(0, str(self.window_attributes.height))
-        self.height_entry.grid(column=1, row=3, padx=(15, 0))
-
-        self.x_label: Label = Label(master, text="X")
-        self.x_label.grid(column=0, row=4, sticky="nw", pady=(15, 0), padx=(5, 0))
-
-        self.x_entry: Entry = Entry(master, validate="key", validatecommand=(self._number_validator, "%P"))
-        self.x_entry.insert(0, str(self.window_attributes.x))
-        self.x_entry.grid(column=0, row=5, padx=(5, 0))
-
-        self.y_label: Label = Label(master, text="Y")
-        self.y_label.grid(column=1, row=4, sticky="nw", pady=(15, 0), padx=(15, 0))
-
-        self.y_entry: Entry = Entry(master, validate="key", validatecommand=(self._number_validator, "%P"))
-        self.y_entry.insert(0, str(self.window_attributes.y))
-        self.y_entry.grid(column=1, row=5, padx=(15, 0))
+        self.width_label, self.width_entry = self._create_number_field("Width", column=0, row=2)
+        self.height_label, self.height_entry = self._create_number_field("Height", column=1, row=2)
+        self.x_label, self.x_entry = self._create_number_field("X", column=0, row=4)
+        self.y_label, self.y_entry = self._create_number_field("Y", column=1, row=4)
 
         self.use_coords_label: Label = Label(master, text="Use coordinates?")
         self.use_coords_label.grid(column=0, row=6, sticky="nw", pady=(15, 0), padx=(5, 0))
 
         self.is_use_coords: IntVar = IntVar()
-        self.is_use_coords.set(self.window_attributes.use_coordinates)
         self.use_coords_check = Checkbutton(master, text="Yes", variable=self.is_use_coords)
         self.use_coords_check.grid(column=0, row=7, padx=(5, 0), sticky="nw")
 
         self.exclude_windows_label = Label(master, text="Exclude windows")
         self.exclude_windows_label.grid(column=0, row=8, pady=(15, 0), padx=(5, 0), sticky="nw")
 
-        if self.windows_attributes_idx >= 0:
-            self.exclude_windows_var: Variable = Variable(
-                value=list(map(lambda x: x.name, self.window_attributes.exclude_windows)))
-        else:
-            self.exclude_windows_var: Variable = Variable(value=[])
-
-        self.exclude_windows_listbox: Listbox = Listbox(master, listvariable=self.exclude_windows_var)
+        self.exclude_windows_listbox: Listbox = Listbox(master)
         self.exclude_windows_listbox.grid(column=0, row=9, sticky="nwse", columnspan=2, padx=(5, 0))
         self.exclude_windows_listbox.bind("<Double-1>", self.edit_exclude_window)
 
@@ -133,6 +104,55 @@ class WindowAttributesElement:
         self.editing_control_buttons.configure_button(0, text="Save", command=self.save_window_attributes)
         self.editing_control_buttons.configure_button(1, text="Exit", command=self.exit)
 
+        # the window is hidden instead of being destroyed so that it can be reused for the next window attributes
+        self.master.protocol("WM_DELETE_WINDOW", self.exit)
+        self.reset(windows_attributes_list, windows_attributes_idx)
+
+    def _create_number_field(self, text: str, column: int, row: int) -> Tuple[Label, Entry]:
+        """
+        Creating a label and a field below it for entering a positive number.
+
+        Args:
+            text (str): Label text.
+            column (int): Grid column of the label and the field.
+            row (int): Grid row of the label, the field is placed in the next row.
+        Returns:
+            The label and the field.
+        """
+        # the first column is closer to the window border
+        padx = (5, 0) if column == 0 else (15, 0)
+        label = Label(self.master, text=text)
+        label.grid(column=column, row=row, sticky="nw", pady=(15, 0), padx=padx)
+        entry = Entry(self.master, validate="key", validatecommand=(self._number_validator, "%P"))
+        entry.grid(column=column, row=row + 1, padx=padx)
+        return label, entry
+
+    def reset(self, windows_attributes_list: List[WindowAttributes], windows_attributes_idx: int):
+        """
+        Filling the existing fields with another window attributes.
+
+        Args:
+            windows_attributes_list (List[WindowAttributes]): List of all window attributes.
+            windows_attributes_idx (int): Index of the window attributes to be viewed.
+        """
+        self.windows_attributes_list = windows_attributes_list
+        self.windows_attributes_idx = windows_attributes_idx
+        self.is_saved: bool = False
+
+        self.window_attributes = WindowAttributes()
+        if self.windows_attributes_idx >= 0:
+            self.window_attributes = self.windows_attributes_list[self.windows_attributes_idx]
+
+        for entry, value in ((self.process_name_entry, self.window_attributes.process_name),
+                             (self.width_entry, self.window_attributes.width),
+                             (self.height_entry, self.window_attributes.height),
+                             (self.x_entry, self.window_attributes.x),
+                             (self.y_entry, self.window_attributes.y)):
+            entry.delete(0, "end")
+            entry.insert(0, str(value))
+        self.is_use_coords.set(self.window_attributes.use_coordinates)
+        self.update_exclude_window_var()
+
     def add_exclude_window(self, event: Event = None):
         """
         Handler for button. If the exclude window are saved, the exclude window will be added to the list.
@@ -142,6 +162,7 @@ class WindowAttributesElement:
         """
         exclude_window_edit = self.get_exclude_window_element()
         exclude_window_element = ExcludeWindowElement(exclude_window_edit, self.window_attributes.exclude_windows, -1)
+        exclude_window_edit.bind("<Destroy>", partial(self.update_exclude_window_row, exclude_window_element))
 
     def remove_exclude_window(self, event: Event = None):
         """
@@ -156,7 +177,6 @@ class WindowAttributesElement:
         else:
             self.exclude_windows_listbox.delete(cur_selection)
             self.window_attributes.exclude_windows.pop(cur_selection[0])
-            self.update_exclude_window_var()
 
     def edit_exclude_window(self, event: Event = None):
         """
@@ -173,15 +193,46 @@ class WindowAttributesElement:
             exclude_window_edit = self.get_exclude_window_element()
             exclude_window_element = ExcludeWindowElement(exclude_window_edit, self.window_attributes.exclude_windows,
                                                           exclude_window_idx)
+            exclude_window_edit.bind("<Destroy>", partial(self.update_exclude_window_row, exclude_window_element))
 
     def update_exclude_window_var(self, event: Event = None):
         """
-        Updating the field responsible for representing the list of window name for each exclude window.
+        Updating the listbox representing the list of window name for each exclude window.
 
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        self.exclude_windows_var.set(list(map(lambda x: x.name, self.window_attributes.exclude_windows)))
+        # all rows are inserted with a single Tcl call
+        self.exclude_windows_listbox.delete(0, "end")
+        self.exclude_windows_listbox.insert("end", *map(_get_name, self.window_attributes.exclude_windows))
+
+    def update_exclude_window_row(self, exclude_window_element: ExcludeWindowElement, event: Event):
+        """
+        Updating the listbox row of the added or edited exclude window after its window is closed.
+
+        Args:
+            exclude_window_element (ExcludeWindowElement): Element in which the exclude window was edited.
+            event (Event): The instance of Event which contains information about what action happened.
+        """
+        # the event is received for every widget in the window, and the row is updated only if the window was saved
+        if str(event.widget) != str(exclude_window_element.master) or not exclude_window_element.is_saved:
+            return
+        exclude_window = exclude_window_element.exclude_window
+        # the window is not modal, so the list may have changed while it was open and the row is looked up by the item
+        exclude_window_idx = next((idx for idx, item in enumerate(self.window_attributes.exclude_windows)
+                                   if item is exclude_window), None)
+        if exclude_window_idx is None:
+            return
+        exclude_window_name = exclude_window.name
+        exclude_windows_listbox = self.exclude_windows_listbox
+        # a new exclude window is added to the end of the list
+        if exclude_window_idx == exclude_windows_listbox.size():
+            exclude_windows_listbox.insert("end", exclude_window_name)
+            return
+        exclude_windows_listbox.delete(exclude_window_idx)
+        exclude_windows_listbox.insert(exclude_window_idx, exclude_window_name)
+        exclude_windows_listbox.selection_clear(0, "end")
+        exclude_windows_listbox.selection_set(exclude_window_idx)
 
     def get_exclude_window_element(self, event: Event = None) -> Toplevel:
         """
@@ -194,9 +245,9 @@ class WindowAttributesElement:
              Window in which to place the elements.
          """
         exclude_window_element = Toplevel(self.master)
-        exclude_window_element.geometry("200x80")
-        exclude_window_element.resizable(0, 0)
-        exclude_window_element.bind("<Destroy>", self.update_exclude_window_var)
+        # the size is set with a single Tcl call
+        exclude_window_element.tk.eval(f"wm geometry {exclude_window_element} 200x80\n"
+                                       f"wm resizable {exclude_window_element} 0 0")
         return exclude_window_element
 
     def save_window_attributes(self, event: Event = None):
@@ -207,31 +258,39 @@ class WindowAttributesElement:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
 
+        process_name = self.process_name_entry.get()
         # check that the process name ends with '.exe'.
-        if not self.process_name_entry.get().endswith(".exe"):
+        if not process_name.endswith(".exe"):
             messagebox.showerror("Invalid process name",
                                  "Invalid process name.\nThe process name must end with '.exe'",
                                  parent=self.master)
             return
 
-        self.window_attributes.process_name = self.process_name_entry.get()
-        self.window_attributes.width = get_number(self.width_entry.get())
-        self.window_attributes.height = get_number(self.height_entry.get())
-        self.window_attributes.x = get_number(self.x_entry.get())
-        self.window_attributes.y = get_number(self.y_entry.get())
-        self.window_attributes.use_coordinates = bool(self.is_use_coords.get())
+        window_attributes = self.window_attributes
+        window_attributes.process_name = process_name
+        window_attributes.width = get_number(self.width_entry.get())
+        window_attributes.height = get_number(self.height_entry.get())
+        window_attributes.x = get_number(self.x_entry.get())
+        window_attributes.y = get_number(self.y_entry.get())
+        window_attributes.use_coordinates = bool(self.is_use_coords.get())
 
         if self.windows_attributes_idx < 0:
             self.windows_attributes_list.append(self.window_attributes)
 
+        self.is_saved = True
         self.exit()
 
     def exit(self, event: Event = None):
         """
-        Closing the master window.
+        Hiding the master window.
 
         Args:
             event (:obj:`Event`, optional): The instance of Event which contains information about what action happened. Defaults to None.
         """
-        self.master.destroy()
-        self.master.update()
+        # exclude window dialogs belong to the current window attributes, so they are closed with it
+        for child in self.master.winfo_children():
+            if isinstance(child, Toplevel):
+                child.destroy()
+        self.master.withdraw()
+        if self._on_exit is not None:
+            self._on_exit(self)
@@ -7,12 +7,24 @@ def is_positive_number(number_str: str) -> bool:
     Returns:
         True if the string is a positive number or empty string, otherwise False
     """
-    if number_str.isdigit():
-        return int(number_str) >= 0
-    elif number_str == "":
-        return True
-    else:
-        return False
+    # a string of decimal digits has no sign, so it cannot be negative and does not need to be converted
+    return number_str == "" or number_str.isdecimal()
+
+
+def get_number_validator(master) -> str:
+    """
+    Function to get the Tcl command that calls is_positive_number.
+    The command is registered once on the root window and shared by all entry fields of the application.
+
+    Args:
+        master: Any window of the application.
+    Returns:
+        Name of the Tcl command to be used in validatecommand.
+    """
+    root = master._root()
+    if not hasattr(root, "_number_validator"):
+        root._number_validator = root.register(is_positive_number)
+    return root._number_validator
 
 
 def get_number(number_str: str) -> int:
@@ -24,7 +36,4 @@ def get_number(number_str: str) -> int:
     Returns:
         The number obtained from the input string.
     """
-    if number_str == "":
-        return 0
-    else:
-        return int(number_str)
+    return int(number_str) if number_str else 0
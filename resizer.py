@@ -1,6 +1,6 @@
 import multiprocessing
 import sys
-from time import sleep
+from multiprocessing.process import BaseProcess
 
 import keyboard
 
@@ -16,8 +16,11 @@ if __name__ == "__main__":
     settings_manager = SettingsManager(settings)
     settings_manager.is_running = True
     if not settings_manager.error:
-        processing_start(settings_manager)
+        worker = processing_start(settings_manager)
         keyboard.wait('ctrl+q')
         settings_manager.is_running = False
         print("\nExit!")
-        sleep(3)
+        # the worker checks the flag on each loop iteration, so waiting for it takes only as long as it needs
+        worker.join(timeout=3)
+        if isinstance(worker, BaseProcess) and worker.is_alive():
+            worker.terminate()
@@ -31,8 +31,9 @@ if __name__ == "__main__":
         application_path = os.path.dirname(__file__)
 
     icon_file = 'favicon.ico'
+    icon_path = os.path.join(application_path, icon_file)
 
-    root.iconbitmap(default=os.path.join(application_path, icon_file))
+    root.iconbitmap(default=icon_path)
 
     # Create tabs control
     tab_control = Notebook(root)
@@ -57,6 +58,9 @@ if __name__ == "__main__":
     settings_menu.add_handle(grid_tab.update_cells_var)
     settings_menu.add_handle(grid_tab.update_use_grid_var)
 
+    # Add handles to prevent processing from starting while a settings file is being read
+    settings_menu.add_load_handles(main_tab.block_start, main_tab.unblock_start)
+
     # Add handle to change objects at processing start
     main_tab.add_start_handle(settings_menu.disable)
     main_tab.add_start_handle(lambda: tab_control.tab(1, state="disabled"))
@@ -80,16 +84,20 @@ if __name__ == "__main__":
         root.after(0, root.deiconify)
 
 
+    # The tray icon and menu are the same each time, so they are created once
+    tray_image = Image.open(icon_path)
+    tray_image.load()
+    tray_menu = (MenuItem("Show", show_window),
+                 MenuItem(lambda text: "Stop processing" if main_tab.is_processing else "Start processing",
+                          lambda x: main_tab.stop_processing() if main_tab.is_processing else main_tab.start_processing()),
+                 MenuItem("Exit", quit_window),
+                 )
+
+
     # Redefinition function when main tab close
     def withdraw_window():
         root.withdraw()
-        image = Image.open(os.path.join(application_path, icon_file))
-        menu = (MenuItem("Show", show_window),
-                MenuItem(lambda text: "Stop processing" if main_tab.is_processing else "Start processing",
-                         lambda x: main_tab.stop_processing() if main_tab.is_processing else main_tab.start_processing()),
-                MenuItem("Exit", quit_window),
-                )
-        icon = pystray.Icon("resizer_icon", image, "Resizer", menu)
+        icon = pystray.Icon("resizer_icon", tray_image, "Resizer", tray_menu)
         icon.run()
 
 
@@ -1,11 +1,19 @@
-from multiprocessing import Value
+from ctypes import c_int
+from multiprocessing.sharedctypes import RawValue
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple
 
 import yaml
-from pydantic import Field, RootModel
+from pydantic import Field, TypeAdapter, field_validator
 from pydantic.dataclasses import dataclass
 
+try:
+    # libyaml parser, it is much faster than the pure Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class IndentDumper(yaml.Dumper):
     """Class to indent yaml dumps"""
@@ -13,8 +21,32 @@ class IndentDumper(yaml.Dumper):
     def increase_indent(self, flow=False, indentless=False):
         return super(IndentDumper, self).increase_indent(flow, False)
 
+    def ignore_aliases(self, data):
+        return True
+
 
-@dataclass
+def _unwrap_items(value):
+    """
+    Get the objects from single-item dicts as they are written in old yaml files, e.g. ``- cell: {x: 0, y: 0}``.
+
+    Args:
+        value: List of objects, single-item dicts or a mix of them.
+    Returns:
+        The list in which every single-item dict is replaced with the mapping stored in it.
+    """
+    if not isinstance(value, list):
+        return value
+    items = []
+    for item in value:
+        if isinstance(item, dict) and len(item) == 1:
+            inner = next(iter(item.values()))
+            if isinstance(inner, dict):
+                item = inner
+        items.append(item)
+    return items
+
+
+@dataclass(slots=True)
 class ExcludeWindow:
     """
     Class that describes the windows to be excluded from processing.
@@ -25,7 +57,7 @@ class ExcludeWindow:
     name: str = Field("")
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowAttributes:
     """
     Class to describe how the window must be displayed
@@ -38,8 +70,6 @@ class WindowAttributes:
         y (int): Window Y coordinate on screen.
         use_coordinates (bool): Whether to display windows of the specified process name at the specified coordinates.
         exclude_windows (list): List of windows to be excluded from processing.
-        additional_width (int): Additional width for accurate sizing.
-        additional_height (int): Additional height for accurate sizing.
     """
     process_name: str = Field("")
     width: int = Field(0)
@@ -47,12 +77,12 @@ class WindowAttributes:
     x: int = Field(0)
     y: int = Field(0)
     use_coordinates: bool = Field(False)
-    exclude_windows: Union[List[Dict[str, ExcludeWindow]], List[ExcludeWindow]] = Field(default_factory=list)
-    additional_width: int = Field(0, exclude=True)
-    additional_height: int = Field(0, exclude=True)
+    exclude_windows: List[ExcludeWindow] = Field(default_factory=list)
 
+    _unwrap_exclude_windows = field_validator("exclude_windows", mode="before")(_unwrap_items)
 
-@dataclass
+
+@dataclass(slots=True)
 class Cell:
     """
     Class for describing a grid cell.
@@ -69,10 +99,7 @@ class Cell:
     hwnd: int = Field(0, exclude=True)
 
     def __lt__(self, other: "Cell") -> bool:
-        if self.x != other.x:
-            return self.x < other.x
-        else:
-            return self.y < other.y
+        return (self.x, self.y) < (other.x, other.y)
 
     def get_coords_str(self) -> str:
         """
@@ -84,7 +111,7 @@ class Cell:
         return f"x={self.x}, y={self.y}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """
     Class to describe settings.
@@ -94,9 +121,38 @@ class Settings:
         using_grid (bool): Whether to use a grid.
         grid (list): List of 'Cell' class.
     """
-    windows_attributes: Union[List[Dict[str, WindowAttributes]], List[WindowAttributes]] = Field(default_factory=list)
+    windows_attributes: List[WindowAttributes] = Field(default_factory=list)
     using_grid: bool = Field(False)
-    grid: Union[List[Dict[str, Cell]], List[Cell]] = Field(default_factory=list)
+    grid: List[Cell] = Field(default_factory=list)
+
+    _unwrap_lists = field_validator("windows_attributes", "grid", mode="before")(_unwrap_items)
+
+
+# the validation schema is built once and run in pydantic-core
+_settings_adapter: TypeAdapter = TypeAdapter(Settings)
+
+
+def _represent_dataclass(dumper: yaml.Dumper, data) -> yaml.MappingNode:
+    """
+    Represent a settings dataclass as a yaml mapping of its fields, the excluded fields are skipped.
+
+    Args:
+        dumper (yaml.Dumper): The dumper that writes the yaml.
+        data: The dataclass instance.
+    Returns:
+        The yaml mapping node.
+    """
+    return dumper.represent_dict({name: getattr(data, name) for name in _dumped_fields[type(data)]})
+
+
+# names of the fields written to the yaml file for each settings class
+_dumped_fields: Dict[type, Tuple[str, ...]] = {
+    cls: tuple(name for name, field in cls.__pydantic_fields__.items() if not field.exclude)
+    for cls in (ExcludeWindow, WindowAttributes, Cell, Settings)
+}
+for _cls in _dumped_fields:
+    # the dataclasses are written directly, without building a dict of the whole model first
+    yaml.add_representer(_cls, _represent_dataclass, Dumper=IndentDumper)
 
 
 def get_settings(path_str: str = "settings.yaml") -> Optional[Settings]:
@@ -112,13 +168,12 @@ def get_settings(path_str: str = "settings.yaml") -> Optional[Settings]:
     if not Path(path_str).exists():
         with open(path_str, "w") as f:
             settings = Settings()
-            dump_of_model = RootModel[Settings](settings).model_dump(by_alias=True)
-            yaml.dump(dump_of_model, f, Dumper=IndentDumper, sort_keys=False)
+            yaml.dump(settings, f, Dumper=IndentDumper, sort_keys=False)
     # read file
     with open(path_str, "r") as f:
         yaml_dict = {}
         try:
-            yaml_dict = yaml.safe_load(f)
+            yaml_dict = yaml.load(f, Loader=SafeLoader)
         except Exception as e:
             print("Invalid setting!")
             print(f"Reason:\n {e}")
@@ -127,7 +182,7 @@ def get_settings(path_str: str = "settings.yaml") -> Optional[Settings]:
         return res
     # passing dict from yaml file to Settings
     try:
-        res = Settings(**yaml_dict)
+        res = _settings_adapter.validate_python(yaml_dict)
     except Exception as e:
         print("Invalid setting!")
         print(f"Reason:\n {e}")
@@ -135,6 +190,17 @@ def get_settings(path_str: str = "settings.yaml") -> Optional[Settings]:
     return res
 
 
+def renumber_grid(settings: Settings):
+    """
+    Rearrange the id's of the grid cells so that they are in order.
+
+    Args:
+        settings (Settings): The Settings instance.
+    """
+    for i, cell in enumerate(settings.grid, 1):
+        cell.id = i
+
+
 def save_settings(settings: Settings, path_str: str = "settings.yaml"):
     """
     Save settings to file
@@ -143,13 +209,9 @@ def save_settings(settings: Settings, path_str: str = "settings.yaml"):
         settings (Settings): The Settings instance.
         path_str (str): Path to the file where the settings are to be saved.
     """
-    # rearrange the id's so that they are in order
-    for i in range(len(settings.grid)):
-        settings.grid[i].id = i + 1
-    dump_of_model = RootModel[Settings](settings).model_dump(by_alias=True)
-    # save to file
-    with open(path_str, "w") as f:
-        yaml.dump(dump_of_model, f, Dumper=IndentDumper)
+    renumber_grid(settings)
+    # the yaml is built in memory and written to the file with a single write
+    Path(path_str).write_text(yaml.dump(settings, Dumper=IndentDumper))
 
 
 class SettingsManager:
@@ -163,68 +225,36 @@ class SettingsManager:
         Args:
             settings: The Settings instance.
         """
+        # a single int is read and written atomically, so the field does not need a lock
+        self._is_running: c_int = RawValue("i", 0)
+        """c_int: process communication field"""
+        self._rebuild(settings)
+
+    def _rebuild(self, settings: Optional[Settings]):
+        """
+        Fill fields from Settings instance.
+        Args:
+            settings: The Settings instance.
+        """
         self._settings: Optional[Settings] = settings
         self._error: bool = False if settings is not None else True
         self._windows_attributes: List[WindowAttributes] = []
         self._grid: List[Cell] = []
 
-        self._is_running: Value = Value("i", 0)
-        """Value: process communication field"""
         if not self._error:
-            if len(self._settings.windows_attributes) > 0:
-                self._prepare_windows_attributes()
-            if len(self._settings.grid) > 0:
-                self._prepare_grid()
-
-            self._settings.windows_attributes = self._windows_attributes
+            # the yaml shape is normalized while parsing, so the lists already hold the dataclasses
+            self._windows_attributes = self._settings.windows_attributes
+            self._grid = sorted(self._settings.grid, key=attrgetter("id"))
             self._settings.grid = self._grid
 
-    def _prepare_windows_attributes(self):
-        if isinstance(self._settings.windows_attributes[0], dict):
-            for window_attributes_dict in self._settings.windows_attributes:
-                # get WindowAttributes from dict
-                window_attributes = next(iter(window_attributes_dict.values()))
-
-                current_exclude_windows_list = []
-                # getting ExcludeWindow for this WindowAttributes
-                if len(window_attributes.exclude_windows) > 0:
-
-                    if isinstance(window_attributes.exclude_windows[0], dict):
-                        for exclude_window_dict in window_attributes.exclude_windows:
-                            # get ExcludeWindow from dict
-                            exclude_window = next(iter(exclude_window_dict.values()))
-                            current_exclude_windows_list.append(exclude_window)
-                    else:
-                        current_exclude_windows_list = window_attributes.exclude_windows
-
-                window_attributes.exclude_windows = current_exclude_windows_list
-
-                self._windows_attributes.append(window_attributes)
-        else:
-            for window_attributes in self._settings.windows_attributes:
-                self._windows_attributes.append(window_attributes)
-
-    def _prepare_grid(self):
-        if isinstance(self._settings.grid[0], dict):
-            # get one value (Cell) from dict.values() and make list of them
-            self._grid = list(map(lambda x: next(iter(x.values())), self._settings.grid))
-            self._grid.sort(key=lambda x: x.id)
-        else:
-            for cell in self._settings.grid:
-                self._grid.append(cell)
-
     def reconfigure(self, settings: Optional[Settings]):
         """
         Update fields from Settings instance.
         Args:
             settings: The Settings instance.
         """
-        new_setting_manager = SettingsManager(settings)
-        self._settings = settings
-        self._error = new_setting_manager._error
-        self._windows_attributes = new_setting_manager._windows_attributes
-        self._grid = new_setting_manager._grid
-        self._is_running = new_setting_manager._is_running
+        # the manager is updated in place, the is_running field is kept so that it stays shared with the worker
+        self._rebuild(settings)
 
     @property
     def error(self) -> bool:
@@ -253,5 +283,4 @@ class SettingsManager:
 
     @is_running.setter
     def is_running(self, value: bool):
-        with self._is_running.get_lock():
-            self._is_running.value = int(value)
+        self._is_running.value = int(value)